@@ -1,12 +1,21 @@
 """Payment processing within billing domain."""
 
+from functools import cached_property
+
 from domains.pd_common.clients import APIClient
-from domains.pd_common.core import BaseService, ValidationError, format_currency
+from domains.pd_common.core import (
+    BaseService,
+    ValidationError,
+    format_currency,
+    generate_id,
+)
 
 
 class Payment:
     """Payment entity."""
 
+    __slots__ = ("payment_id", "amount", "currency", "workspace_id", "status")
+
     def __init__(self, payment_id, amount, currency, workspace_id):
         self.payment_id = payment_id
         self.amount = amount
@@ -22,9 +31,10 @@ class Payment:
 class PaymentService(BaseService):
     """Service for payment processing."""
 
-    def __init__(self):
-        super().__init__()
-        self.payment_gateway = APIClient("https://payment-api.com", "key")
+    @cached_property
+    def payment_gateway(self):
+        """Payment gateway client, created on first use."""
+        return APIClient("https://payment-api.com", "key")
 
     def process_payment(self, amount, currency, workspace_id):
         """Process a payment."""
@@ -32,7 +42,7 @@ class PaymentService(BaseService):
             raise ValidationError("Payment amount must be positive")
 
         payment = Payment(
-            payment_id=f"pay_{hash(f'{amount}{workspace_id}')}",
+            payment_id=generate_id("pay", f"{amount}{workspace_id}"),
             amount=amount,
             currency=currency,
             workspace_id=workspace_id,
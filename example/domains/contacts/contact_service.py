@@ -5,21 +5,21 @@ class ContactService:
     """Service for managing contacts."""
 
     def __init__(self):
-        self.contacts = []
+        self.contacts = {}
+        self._next_id = 1
 
     def add_contact(self, name, email):
         """Add a new contact."""
-        contact = {"name": name, "email": email, "id": len(self.contacts) + 1}
-        self.contacts.append(contact)
+        contact_id = self._next_id
+        self._next_id += 1
+        contact = {"name": name, "email": email, "id": contact_id}
+        self.contacts[contact_id] = contact
         return contact
 
     def get_contact(self, contact_id):
         """Get contact by ID."""
-        for contact in self.contacts:
-            if contact["id"] == contact_id:
-                return contact
-        return None
+        return self.contacts.get(contact_id)
 
     def list_contacts(self):
         """List all contacts."""
-        return self.contacts.copy()
+        return list(self.contacts.values())
@@ -1,26 +1,29 @@
 """Integration tests for document workflow."""
 
-import unittest
+import pytest
 
 # These imports should be caught by import linter rules
 from domains.org_and_user.organization_service import OrganizationService
 from domains.billing.billing_operations_violations import BillingOperationsService
 
 
-class TestDocumentWorkflow(unittest.TestCase):
-    """Test document workflow integration."""
+@pytest.fixture(scope="module")
+def org_service():
+    """Organization service shared by the tests in this module."""
+    return OrganizationService()
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.org_service = OrganizationService()
-        self.billing_ops = BillingOperationsService()
 
-    def test_document_workflow_with_billing(self):
-        """Test document workflow with billing integration."""
-        # Test code would go here
-        pass
+@pytest.fixture(scope="module")
+def billing_ops():
+    """Billing operations service shared by the tests in this module."""
+    return BillingOperationsService()
 
-    def test_document_workflow_with_organization(self):
-        """Test document workflow with organization integration."""
-        # Test code would go here
-        pass
+
+def test_document_workflow_with_billing(billing_ops):
+    """Test document workflow with billing integration."""
+    # Test code would go here
+
+
+def test_document_workflow_with_organization(org_service):
+    """Test document workflow with organization integration."""
+    # Test code would go here
@@ -1,19 +1,17 @@
 """Test that imports from contacts domain."""
 
-import unittest
+import pytest
 
 # This import should be caught by import linter rules
 from domains.contacts.contact_service import ContactService
 
 
-class TestContactIntegration(unittest.TestCase):
-    """Test contact integration."""
+@pytest.fixture(scope="module")
+def contact_service():
+    """Contact service shared by the tests in this module."""
+    return ContactService()
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.contact_service = ContactService()
 
-    def test_contact_creation(self):
-        """Test contact creation."""
-        # Test code would go here
-        pass
+def test_contact_creation(contact_service):
+    """Test contact creation."""
+    # Test code would go here
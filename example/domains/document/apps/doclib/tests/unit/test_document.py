@@ -1,26 +1,29 @@
 """Unit tests for document functionality."""
 
-import unittest
+import pytest
 
 # These imports should be caught by import linter rules
 from domains.org_and_user.users import UserService
 from domains.billing.payments import PaymentService
 
 
-class TestDocumentFunctionality(unittest.TestCase):
-    """Test document functionality."""
+@pytest.fixture(scope="module")
+def user_service():
+    """User service shared by the tests in this module."""
+    return UserService()
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.user_service = UserService()
-        self.payment_service = PaymentService()
 
-    def test_document_creation(self):
-        """Test document creation."""
-        # Test code would go here
-        pass
+@pytest.fixture(scope="module")
+def payment_service():
+    """Payment service shared by the tests in this module."""
+    return PaymentService()
 
-    def test_document_validation(self):
-        """Test document validation."""
-        # Test code would go here
-        pass
+
+def test_document_creation(user_service, payment_service):
+    """Test document creation."""
+    # Test code would go here
+
+
+def test_document_validation(user_service, payment_service):
+    """Test document validation."""
+    # Test code would go here
@@ -1,26 +1,29 @@
 """Unit tests for template functionality."""
 
-import unittest
+import pytest
 
 # These imports should be caught by import linter rules
 from domains.org_and_user.workspaces import WorkspaceService
 from domains.pd_common.clients import APIClient
 
 
-class TestTemplateFunctionality(unittest.TestCase):
-    """Test template functionality."""
+@pytest.fixture(scope="module")
+def workspace_service():
+    """Workspace service shared by the tests in this module."""
+    return WorkspaceService()
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.workspace_service = WorkspaceService()
-        self.api_client = APIClient("http://example.com", "test-key")
 
-    def test_template_rendering(self):
-        """Test template rendering."""
-        # Test code would go here
-        pass
+@pytest.fixture(scope="module")
+def api_client():
+    """API client shared by the tests in this module."""
+    return APIClient("http://example.com", "test-key")
 
-    def test_template_validation(self):
-        """Test template validation."""
-        # Test code would go here
-        pass
+
+def test_template_rendering(workspace_service, api_client):
+    """Test template rendering."""
+    # Test code would go here
+
+
+def test_template_validation(workspace_service, api_client):
+    """Test template validation."""
+    # Test code would go here
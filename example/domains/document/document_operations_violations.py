@@ -35,7 +35,7 @@ class DocumentOperationsService(BaseService):
 
         # Direct access to workspace domain (violation)
         workspace = self.workspace_service.create_workspace(
-            name=f"{user.name}'s Workspace", owner_email=user_email
+            name=f"{user.name}'s Workspace", owner_email=user_email, owner=user
         )
 
         # Create document
@@ -1,7 +1,7 @@
 """Core document functionality."""
 
 # Note: The following import would be flagged as a DDD violation - testing clean config
-from domains.pd_common.core import BaseService, ValidationError
+from domains.pd_common.core import BaseService, ValidationError, generate_id
 
 from domains.billing.payments import PaymentService  # This should be flagged
 
@@ -9,6 +9,8 @@ from domains.billing.payments import PaymentService  # This should be flagged
 class Document:
     """Document entity."""
 
+    __slots__ = ("document_id", "title", "content", "workspace_id", "status")
+
     def __init__(self, document_id, title, content, workspace_id):
         self.document_id = document_id
         self.title = title
@@ -30,7 +32,7 @@ class DocumentService(BaseService):
             raise ValidationError("Document title is required")
 
         document = Document(
-            document_id=f"doc_{hash(title + workspace_id)}",
+            document_id=generate_id("doc", title + workspace_id),
             title=title,
             content=content,
             workspace_id=workspace_id,
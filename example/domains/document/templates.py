@@ -1,6 +1,6 @@
 """Template management within document domain."""
 
-from domains.pd_common.core import BaseService
+from domains.pd_common.core import BaseService, generate_id
 
 from .documents_core import DocumentService
 
@@ -8,6 +8,8 @@ from .documents_core import DocumentService
 class Template:
     """Template entity."""
 
+    __slots__ = ("template_id", "name", "content", "variables")
+
     def __init__(self, template_id, name, content):
         self.template_id = template_id
         self.name = name
@@ -24,7 +26,7 @@ class TemplateService(BaseService):
 
     def create_template(self, name, content):
         """Create a new template."""
-        template = Template(template_id=f"tpl_{hash(name)}", name=name, content=content)
+        template = Template(template_id=generate_id("tpl", name), name=name, content=content)
         return template
 
     def create_document_from_template(self, template_id, workspace_id, title=None):
@@ -31,11 +31,14 @@ class OrganizationService(BaseService):
         inviter = self.user_service.get_user_by_email(inviter_email)
 
         # Create or get invited user
-        invited_user = self.user_service.get_user_by_email(user_email)
+        if user_email == inviter_email:
+            invited_user = inviter
+        else:
+            invited_user = self.user_service.get_user_by_email(user_email)
 
         # Add to workspace
         result = self.workspace_service.add_member_to_workspace(
-            workspace_id=workspace_id, user_email=user_email
+            workspace_id=workspace_id, user_email=user_email, user=invited_user
         )
 
         return {"inviter": inviter, "invited_user": invited_user, "success": result}
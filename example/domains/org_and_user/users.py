@@ -1,12 +1,16 @@
 """User management within org_and_user domain."""
 
+from functools import cached_property
+
 from domains.pd_common.clients import EmailClient
-from domains.pd_common.core import BaseService, ValidationError
+from domains.pd_common.core import BaseService, ValidationError, generate_id
 
 
 class User:
     """User entity."""
 
+    __slots__ = ("user_id", "email", "name", "is_active")
+
     def __init__(self, user_id, email, name):
         self.user_id = user_id
         self.email = email
@@ -21,16 +25,17 @@ class User:
 class UserService(BaseService):
     """Service for user management operations."""
 
-    def __init__(self):
-        super().__init__()
-        self.email_client = EmailClient()
+    @cached_property
+    def email_client(self):
+        """Email client, created on first use."""
+        return EmailClient()
 
     def create_user(self, email, name):
         """Create a new user."""
         if not email or "@" not in email:
             raise ValidationError("Invalid email address")
 
-        user = User(user_id=f"user_{hash(email)}", email=email, name=name)
+        user = User(user_id=generate_id("user", email), email=email, name=name)
 
         self.email_client.send_email(to=email, subject="Welcome!", body=f"Welcome {name}!")
 
@@ -39,4 +44,4 @@ class UserService(BaseService):
     def get_user_by_email(self, email):
         """Retrieve user by email."""
         # Mock implementation
-        return User(f"user_{hash(email)}", email, "John Doe")
+        return User(generate_id("user", email), email, "John Doe")
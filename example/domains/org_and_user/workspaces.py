@@ -1,6 +1,6 @@
 """Workspace management within org_and_user domain."""
 
-from domains.pd_common.core import BaseService, ValidationError
+from domains.pd_common.core import BaseService, ValidationError, generate_id
 
 from .users import UserService
 
@@ -8,16 +8,17 @@ from .users import UserService
 class Workspace:
     """Workspace entity."""
 
+    __slots__ = ("workspace_id", "name", "owner_id", "members")
+
     def __init__(self, workspace_id, name, owner_id):
         self.workspace_id = workspace_id
         self.name = name
         self.owner_id = owner_id
-        self.members = []
+        self.members = set()
 
     def add_member(self, user_id):
         """Add member to workspace."""
-        if user_id not in self.members:
-            self.members.append(user_id)
+        self.members.add(user_id)
 
 
 class WorkspaceService(BaseService):
@@ -27,25 +28,27 @@ class WorkspaceService(BaseService):
         super().__init__()
         self.user_service = UserService()  # OK: internal domain dependency
 
-    def create_workspace(self, name, owner_email):
-        """Create a new workspace."""
+    def create_workspace(self, name, owner_email, owner=None):
+        """Create a new workspace, reusing ``owner`` if the caller already looked it up."""
         if not name:
             raise ValidationError("Workspace name is required")
 
         # Get owner user
-        owner = self.user_service.get_user_by_email(owner_email)
+        if owner is None:
+            owner = self.user_service.get_user_by_email(owner_email)
 
         workspace = Workspace(
-            workspace_id=f"ws_{hash(name + owner_email)}",
+            workspace_id=generate_id("ws", name + owner_email),
             name=name,
             owner_id=owner.user_id,
         )
 
         return workspace
 
-    def add_member_to_workspace(self, workspace_id, user_email):
-        """Add member to workspace."""
-        user = self.user_service.get_user_by_email(user_email)
+    def add_member_to_workspace(self, workspace_id, user_email, user=None):
+        """Add member to workspace, reusing ``user`` if the caller already looked it up."""
+        if user is None:
+            user = self.user_service.get_user_by_email(user_email)
         # Mock workspace retrieval and member addition
-        print(f"Adding user {user.email} to workspace {workspace_id}")
+        self.logger.info("Adding user %s to workspace %s", user.email, workspace_id)
         return True
@@ -1,5 +1,9 @@
 """External API clients and integrations."""
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class APIClient:
     """Base API client."""
@@ -19,5 +23,5 @@ class EmailClient:
 
     def send_email(self, to, subject, body):
         """Send email notification."""
-        print(f"Sending email to {to}: {subject}")
+        logger.info("Sending email to %s: %s", to, subject)
         return True
@@ -1,17 +1,18 @@
 """Core utilities and base classes shared across all domains."""
 
+import logging
+from hashlib import blake2b
+
 
 class BaseService:
     """Base service class for all domain services."""
 
-    def __init__(self):
-        self.logger = self._setup_logging()
-
-    def _setup_logging(self):
-        """Setup logging for the service."""
-        import logging
+    logger = logging.getLogger("BaseService")
 
-        return logging.getLogger(self.__class__.__name__)
+    def __init_subclass__(cls, **kwargs):
+        """Give each service subclass its own logger, created once per class."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
 
 
 class ValidationError(Exception):
@@ -20,6 +21,15 @@ class ValidationError(Exception):
     pass
 
 
+# Keeps the sign-space flag of the original " .2f" spec
+_CURRENCY_FORMAT = "%s % .2f"
+
+
 def format_currency(amount, currency_code="USD"):
     """Format currency amount."""
-    return f"{currency_code} {amount: .2f}"
+    return _CURRENCY_FORMAT % (currency_code, amount)
+
+
+def generate_id(prefix, key):
+    """Generate a stable identifier from a string key."""
+    return f"{prefix}_{blake2b(key.encode(), digest_size=8).hexdigest()}"
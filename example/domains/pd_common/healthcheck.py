@@ -11,10 +11,16 @@ def check_redis_health():
     return {"status": "healthy", "service": "redis"}
 
 
-def get_system_health():
-    """Get overall system health status."""
-    checks = [check_database_health(), check_redis_health()]
+HEALTH_CHECKS = (check_database_health, check_redis_health)
 
-    all_healthy = all(check["status"] == "healthy" for check in checks)
 
-    return {"status": "healthy" if all_healthy else "unhealthy", "checks": checks}
+def get_system_health():
+    """Get overall system health status, stopping at the first unhealthy check."""
+    checks = []
+    for health_check in HEALTH_CHECKS:
+        check = health_check()
+        checks.append(check)
+        if check["status"] != "healthy":
+            return {"status": "unhealthy", "checks": checks}
+
+    return {"status": "healthy", "checks": checks}
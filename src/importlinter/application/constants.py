@@ -5,6 +5,8 @@ These constants are used across both CLI and pylint plugin modes to ensure
 consistent error reporting and message IDs.
 """
 
+from types import MappingProxyType
+
 # Message IDs for different types of contract violations
 # These follow the pattern: import-<violation-type>-violation
 IMPORT_BOUNDARY_VIOLATION = "import-boundary-violation"
@@ -13,7 +15,9 @@ IMPORT_INDEPENDENCE_VIOLATION = "import-independence-violation"
 IMPORT_CONTRACT_VIOLATION = "import-contract-violation"
 IMPORT_CONTRACT_ERROR = "import-contract-error"
 
-# Mapping of contract types to their specific message IDs
+# Mapping of contract types to their specific message IDs.
+# Keys are looked up with contract class ``__name__`` values; both those and these identifier
+# literals are interned by CPython, so lookups hit the identity fast path without sys.intern().
 CONTRACT_TYPE_TO_MESSAGE_ID = {
     "ForbiddenContract": IMPORT_BOUNDARY_VIOLATION,
     "LayersContract": IMPORT_LAYER_VIOLATION,
@@ -23,33 +27,44 @@ CONTRACT_TYPE_TO_MESSAGE_ID = {
 # Default message ID for unknown contract types
 DEFAULT_CONTRACT_MESSAGE_ID = IMPORT_CONTRACT_VIOLATION
 
-# Pylint message definitions for import-linter violations
-MESSAGES = {
-    "E9001": (
-        "Import contract violation: %s",
-        IMPORT_CONTRACT_VIOLATION,
-        "Import violates architecture contract defined in .importlinter configuration",
-    ),
-    "E9002": (
-        "Import contract error: %s",
-        IMPORT_CONTRACT_ERROR,
-        "Error occurred while checking import contracts",
-    ),
-    "E9003": (
-        "Domain boundary violation: %s",
-        IMPORT_BOUNDARY_VIOLATION,
-        "Import violates domain boundaries defined by forbidden contract rules",
-    ),
-    "E9004": (
-        "Layer violation: %s",
-        IMPORT_LAYER_VIOLATION,
-        "Import violates layer architecture defined by layers contract rules",
-    ),
-    "E9005": (
-        "Independence violation: %s",
-        IMPORT_INDEPENDENCE_VIOLATION,
-        "Import violates module independence defined by independence contract rules",
-    ),
+# Pylint message definitions for import-linter violations (read-only)
+MESSAGES = MappingProxyType(
+    {
+        "E9001": (
+            "Import contract violation: %s",
+            IMPORT_CONTRACT_VIOLATION,
+            "Import violates architecture contract defined in .importlinter configuration",
+        ),
+        "E9002": (
+            "Import contract error: %s",
+            IMPORT_CONTRACT_ERROR,
+            "Error occurred while checking import contracts",
+        ),
+        "E9003": (
+            "Domain boundary violation: %s",
+            IMPORT_BOUNDARY_VIOLATION,
+            "Import violates domain boundaries defined by forbidden contract rules",
+        ),
+        "E9004": (
+            "Layer violation: %s",
+            IMPORT_LAYER_VIOLATION,
+            "Import violates layer architecture defined by layers contract rules",
+        ),
+        "E9005": (
+            "Independence violation: %s",
+            IMPORT_INDEPENDENCE_VIOLATION,
+            "Import violates module independence defined by independence contract rules",
+        ),
+    }
+)
+
+# Base violation message templates, keyed by message ID
+DEFAULT_VIOLATION_MESSAGE_TEMPLATE = "Contract validation failed for '{contract_name}' rule"
+VIOLATION_MESSAGE_TEMPLATES = {
+    IMPORT_BOUNDARY_VIOLATION: "Forbidden import detected - violates '{contract_name}' rule",
+    IMPORT_LAYER_VIOLATION: "Layer boundary violated - violates '{contract_name}' rule",
+    IMPORT_INDEPENDENCE_VIOLATION: "Module independence violated - violates '{contract_name}' rule",
+    IMPORT_CONTRACT_VIOLATION: DEFAULT_VIOLATION_MESSAGE_TEMPLATE,
 }
 
 
@@ -70,18 +85,8 @@ def format_violation_message(
     Returns:
         A formatted violation message string
     """
-    base_messages = {
-        IMPORT_BOUNDARY_VIOLATION: f"Forbidden import detected - violates '{contract_name}' rule",
-        IMPORT_LAYER_VIOLATION: f"Layer boundary violated - violates '{contract_name}' rule",
-        IMPORT_INDEPENDENCE_VIOLATION: (
-            f"Module independence violated - violates '{contract_name}' rule"
-        ),
-        IMPORT_CONTRACT_VIOLATION: f"Contract validation failed for '{contract_name}' rule",
-    }
-
-    base_msg = base_messages.get(
-        message_id, f"Contract validation failed for '{contract_name}' rule"
-    )
+    template = VIOLATION_MESSAGE_TEMPLATES.get(message_id, DEFAULT_VIOLATION_MESSAGE_TEMPLATE)
+    base_msg = template.format(contract_name=contract_name)
 
     # Add specific violation details if provided
     if violation_details:
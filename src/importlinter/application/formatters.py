@@ -21,11 +21,14 @@ def format_report_as_json(report: Any, folder_info: str = "") -> str:
     This provides structured output compatible with the pylint plugin format
     for consistent tooling integration.
     """
+    # Materialise once: the pairs are needed both for the total and for the main loop.
+    contracts_and_checks = list(report.get_contracts_and_checks())
+
     result: dict[str, Any] = {
         "summary": {
             "analyzed_files": getattr(report, "number_of_modules", 0),
             "dependencies": getattr(report, "number_of_dependencies", 0),
-            "contracts_total": len(list(report.get_contracts_and_checks())),
+            "contracts_total": len(contracts_and_checks),
             "contracts_kept": 0,
             "contracts_broken": 0,
             "has_violations": report.contains_failures,
@@ -34,49 +37,85 @@ def format_report_as_json(report: Any, folder_info: str = "") -> str:
         "contracts": [],
     }
 
+    if not report.contains_failures:
+        # Every contract was kept, so there are no violations to assemble.
+        result["summary"]["contracts_kept"] = len(contracts_and_checks)
+        result["contracts"] = [
+            {"name": contract.name, "type": contract.__class__.__name__, "kept": True}
+            for contract, _ in contracts_and_checks
+        ]
+        return json.dumps(result, indent=2)
+
     # Process contracts and violations
-    for contract, contract_check in report.get_contracts_and_checks():
-        contract_info = {
-            "name": contract.name,
-            "type": contract.__class__.__name__,
-            "kept": contract_check.kept,
-        }
+    for contract, contract_check in contracts_and_checks:
+        contract_info = _build_contract_entry(contract, contract_check, folder_info)
 
         if contract_check.kept:
             result["summary"]["contracts_kept"] += 1
         else:
             result["summary"]["contracts_broken"] += 1
+            result["violations"].append(contract_info["violation"])
 
-            # Get the appropriate message ID for this contract type
-            contract_type = contract.__class__.__name__
-            message_id = get_message_id_for_contract_type(contract_type)
+        result["contracts"].append(contract_info)
 
-            # Create violation entry compatible with pylint plugin format
-            violation = {
-                "symbol": message_id,
-                "contract_name": contract.name,
-                "contract_type": contract_type,
-                "message": format_violation_message(contract.name, contract_type, folder_info),
-                "details": [],
-            }
+    return json.dumps(result, indent=2)
 
-            # Add specific violation details if available
-            if hasattr(contract_check, "metadata") and contract_check.metadata:
-                if "invalid_chains" in contract_check.metadata:
-                    for chain in contract_check.metadata["invalid_chains"]:
-                        violation["details"].append(
-                            {
-                                "import_chain": str(chain),
-                                "line_number": getattr(chain, "line_number", None),
-                            }
-                        )
 
-            result["violations"].append(violation)
-            contract_info["violation"] = violation
+def _build_contract_entry(
+    contract: Any, contract_check: Any, folder_info: str = ""
+) -> dict[str, Any]:
+    """
+    Build the JSON entry for a single contract.
 
-        result["contracts"].append(contract_info)
+    Broken contracts also get a "violation" entry, compatible with the pylint plugin format.
+    """
+    contract_type = contract.__class__.__name__
+    contract_info: dict[str, Any] = {
+        "name": contract.name,
+        "type": contract_type,
+        "kept": contract_check.kept,
+    }
 
-    return json.dumps(result, indent=2)
+    if not contract_check.kept:
+        # Get the appropriate message ID for this contract type
+        message_id = get_message_id_for_contract_type(contract_type)
+
+        # Create violation entry compatible with pylint plugin format
+        violation: dict[str, Any] = {
+            "symbol": message_id,
+            "contract_name": contract.name,
+            "contract_type": contract_type,
+            "message": format_violation_message(contract.name, contract_type, folder_info),
+            "details": [],
+        }
+
+        # Add specific violation details if available
+        if hasattr(contract_check, "metadata") and contract_check.metadata:
+            if "invalid_chains" in contract_check.metadata:
+                for chain in contract_check.metadata["invalid_chains"]:
+                    violation["details"].append(
+                        {
+                            "import_chain": _format_import_chain(chain),
+                            "line_number": getattr(chain, "line_number", None),
+                        }
+                    )
+
+        contract_info["violation"] = violation
+
+    return contract_info
+
+
+def _format_import_chain(chain: Any) -> str:
+    """
+    Render an invalid chain as a string.
+
+    Chains exposing a ``modules`` sequence are joined in a single pass; anything else
+    (such as the metadata dicts of the built-in contracts) falls back to ``str()``.
+    """
+    modules = getattr(chain, "modules", None)
+    if modules is None:
+        return str(chain)
+    return " -> ".join(getattr(module, "name", module) for module in modules)
 
 
 def format_report_as_json2(report: Any, folder_info: str = "") -> str:
@@ -20,15 +20,11 @@ from importlinter.application.constants import (
     format_violation_message,
     get_message_id_for_contract_type,
 )
-from importlinter.configuration import configure
 
 from .config import PLUGIN_OPTIONS
 from .module_resolver import ModulePathResolver
 from .contract_checker import ContractChecker
 
-# Configure import-linter
-configure()
-
 
 class ImportLinterChecker(checkers.BaseChecker):
     """Pylint checker that enforces import-linter contracts."""
@@ -42,11 +38,17 @@ class ImportLinterChecker(checkers.BaseChecker):
         self._contracts_checked = False
         self._first_module_node = None
         self._analyzed_files: set[str] = set()
-        self._module_nodes: dict[str, Any] = {}  # Store module nodes by file path
         self._import_nodes: list[Any] = []  # Store import nodes for line-specific reporting
+        self._import_nodes_by_file: dict[str, list[Any]] = {}  # Same nodes, by owning file
         self._contracts_cache: Any = None  # Cache contracts for import checking
         self._single_file_mode = False  # Track if we're analyzing just one file
         self._target_module_name: str | None = None  # Store the module name being analyzed
+        # (target, exclude) folder prefixes, read from the configuration once per run
+        self._folder_prefixes: tuple[tuple[str, ...], tuple[str, ...]] | None = None
+        self._folder_decisions: dict[str, bool] = {}  # _file_in_targets() by file, per run
+        self._message_ids: dict[type, str] = {}  # Message ID by contract class
+        # Violation (message ID, message) by (importer, imported) module pair, per run
+        self._pair_violations: dict[tuple[str, str], tuple[str, str] | None] = {}
 
         # Initialize helper components immediately with config
         debug = getattr(linter.config, "import_linter_debug", False)
@@ -59,27 +61,39 @@ class ImportLinterChecker(checkers.BaseChecker):
 
     def _setup_pythonpath(self) -> None:
         """Set up PYTHONPATH for import resolution."""
+        cwd = os.getcwd()
+        pythonpath_entries = tuple(self.linter.config.import_linter_pythonpath or ())
+
+        # pylint restores sys.path after each run, so this is redone on every open()
+        sys_path_entries = set(sys.path)
+
         # Add current directory to path for import resolution
-        if os.getcwd() not in sys.path:
-            sys.path.insert(0, os.getcwd())
+        if cwd not in sys_path_entries:
+            sys.path.insert(0, cwd)
+            sys_path_entries.add(cwd)
 
         # Add configured PYTHONPATH entries
-        pythonpath_entries = self.linter.config.import_linter_pythonpath or ()
+        current_pythonpath = os.environ.get("PYTHONPATH", "")
+        env_entries = set(current_pythonpath.split(os.pathsep))
+        new_env_entries: list[str] = []
         for path_entry in pythonpath_entries:
             # Convert relative paths to absolute paths
             if not os.path.isabs(path_entry):
                 path_entry = os.path.abspath(path_entry)
 
-            if path_entry not in sys.path:
+            if path_entry not in sys_path_entries:
                 sys.path.insert(0, path_entry)
+                sys_path_entries.add(path_entry)
+
+            # Also set in environment for import-linter (each entry is prepended)
+            if path_entry not in env_entries:
+                new_env_entries.insert(0, path_entry)
+                env_entries.add(path_entry)
 
-            # Also set in environment for import-linter
-            current_pythonpath = os.environ.get("PYTHONPATH", "")
-            if path_entry not in current_pythonpath.split(os.pathsep):
-                if current_pythonpath:
-                    os.environ["PYTHONPATH"] = f"{path_entry}{os.pathsep}{current_pythonpath}"
-                else:
-                    os.environ["PYTHONPATH"] = path_entry
+        if new_env_entries:
+            if current_pythonpath:
+                new_env_entries.append(current_pythonpath)
+            os.environ["PYTHONPATH"] = os.pathsep.join(new_env_entries)
 
         # Debug output for PYTHONPATH setup
         if self.linter.config.import_linter_verbose and pythonpath_entries:
@@ -94,46 +108,68 @@ class ImportLinterChecker(checkers.BaseChecker):
             if self._single_file_mode:
                 self._optimize_for_single_file()
 
+            # Always build the report, so that configuration errors are reported
             self._check_import_contracts()
-            self._check_individual_imports()  # Check individual imports for line-specific reporting
+            if self._has_imports_to_check():
+                # Check individual imports for line-specific reporting
+                self._check_individual_imports()
             self._contracts_checked = True
 
+        # Contracts are only checked once, so the import nodes (and through them, their
+        # ASTs) needn't outlive this run.
+        self._import_nodes.clear()
+        self._import_nodes_by_file.clear()
+        self._folder_prefixes = None
+        self._folder_decisions.clear()
+        self._pair_violations.clear()
+        self._module_resolver.clear_cache()
+        self._contract_checker.clear_cache()
+
     def _should_check_contracts(self) -> bool:
         """Determine if we should check contracts based on folder configuration."""
-        target_folders = self.linter.config.import_linter_target_folders or ()
-        exclude_folders = self.linter.config.import_linter_exclude_folders or ()
+        target_prefixes, exclude_prefixes = self._get_folder_prefixes()
 
         # If no specific folders are configured, check all analyzed files
-        if not target_folders and not exclude_folders:
+        if not target_prefixes and not exclude_prefixes:
             return bool(self._analyzed_files)
 
         # Check if any analyzed files match target folders or don't match exclude folders
-        for file_path in self._analyzed_files:
-            # Convert to relative path for comparison
-            rel_path = os.path.relpath(file_path)
-
-            # Check exclusions first
-            if exclude_folders:
-                excluded = any(
-                    rel_path.startswith(folder) or rel_path.startswith(folder + os.sep)
-                    for folder in exclude_folders
-                )
-                if excluded:
-                    continue
-
-            # Check inclusions
-            if target_folders:
-                included = any(
-                    rel_path.startswith(folder) or rel_path.startswith(folder + os.sep)
-                    for folder in target_folders
-                )
-                if included:
-                    return True
-            else:
-                # No target folders specified, include if not excluded
-                return True
+        return any(self._file_in_targets(file_path) for file_path in self._analyzed_files)
+
+    def _get_folder_prefixes(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return the configured (target, exclude) folders as tuples, built once per run."""
+        if self._folder_prefixes is None:
+            config = self.linter.config
+            self._folder_prefixes = (
+                tuple(config.import_linter_target_folders or ()),
+                tuple(config.import_linter_exclude_folders or ()),
+            )
+        return self._folder_prefixes
 
-        return False
+    def _file_in_targets(self, file_path: str) -> bool:
+        """Whether a file is in a target folder (if any are set) and in no excluded folder."""
+        try:
+            return self._folder_decisions[file_path]
+        except KeyError:
+            in_targets = self._folder_decisions[file_path] = self._file_in_targets_uncached(
+                file_path
+            )
+            return in_targets
+
+    def _file_in_targets_uncached(self, file_path: str) -> bool:
+        """Decide whether a file is in the target folders, without caching."""
+        target_prefixes, exclude_prefixes = self._get_folder_prefixes()
+
+        # str.startswith() accepts a tuple and tests every prefix in a single C-level call.
+        # A bare folder prefix also covers the "folder + os.sep" form, so one tuple suffices.
+        rel_path = self._module_resolver.get_relative_path(file_path)
+
+        # Check exclusions first
+        if exclude_prefixes and rel_path.startswith(exclude_prefixes):
+            return False
+
+        # Check inclusions; with no target folders, include anything not excluded
+        return not target_prefixes or rel_path.startswith(target_prefixes)
 
     def _optimize_for_single_file(self) -> None:
         """Optimize settings when analyzing only a single file."""
@@ -154,6 +190,24 @@ class ImportLinterChecker(checkers.BaseChecker):
             if not self.linter.config.import_linter_cache_dir:
                 self.linter.config.import_linter_cache_dir = ".import_linter_cache"
 
+    def _has_imports_to_check(self) -> bool:
+        """
+        Whether any analyzed import could be reported on.
+
+        Violations are only ever reported against import nodes, so in fast mode a file
+        without imports doesn't need them matched against the broken contracts.
+        """
+        if not (self._single_file_mode and self.linter.config.import_linter_fast_mode):
+            return True
+
+        single_file = next(iter(self._analyzed_files))
+        if single_file in self._import_nodes_by_file:
+            return True
+
+        if self.linter.config.import_linter_verbose:
+            print("Import-linter: Fast mode skipped import checks for a file without imports")
+        return False
+
     def _check_import_contracts(self) -> None:
         """Run import-linter contract checking."""
         result = self._contract_checker.check_import_contracts(
@@ -176,21 +230,15 @@ class ImportLinterChecker(checkers.BaseChecker):
         if not self._contracts_cache:
             return
 
-        debug = self.linter.config.import_linter_debug
+        config = self.linter.config
+        debug = config.import_linter_debug
         import_nodes_to_check = self._import_nodes
 
         # Optimization for single-file mode with fast mode enabled
-        if (
-            self._single_file_mode
-            and self.linter.config.import_linter_fast_mode
-            and self._target_module_name
-        ):
-            # Filter import nodes to only those from our target file
-            import_nodes_to_check = [
-                node
-                for node in self._import_nodes
-                if (hasattr(node.root(), "file") and node.root().file in self._analyzed_files)
-            ]
+        if self._single_file_mode and config.import_linter_fast_mode and self._target_module_name:
+            # Only check import nodes from our target file
+            single_file = next(iter(self._analyzed_files))
+            import_nodes_to_check = self._import_nodes_by_file.get(single_file, [])
             if debug:
                 print(
                     f"Debug: Fast mode filtered to {len(import_nodes_to_check)} "
@@ -200,112 +248,182 @@ class ImportLinterChecker(checkers.BaseChecker):
         if debug:
             print(f"Debug: Checking {len(import_nodes_to_check)} import nodes for violations")
 
+        # Imports of modules no broken contract could be about are skipped cheaply
+        imported_prefixes = self._contract_checker.get_imported_module_prefixes(
+            self._contracts_cache
+        )
+        if imported_prefixes == ():
+            if debug:
+                print("Debug: No broken contract can match an import, skipping import checks")
+            return
+
+        # Violation messages are only built if pylint would report at least one of them
+        if not self._any_violation_message_enabled():
+            if debug:
+                print("Debug: Violation messages are disabled, skipping import checks")
+            return
+
+        # The folder context is the same for every violation, so build it once
+        folder_msg = ""
+        target_folders, _ = self._get_folder_prefixes()
+        if target_folders:
+            folder_msg = f" (targeting folders: {', '.join(target_folders)})"
+
+        # Collect violations first so each unique one goes through pylint's message
+        # machinery once, keyed by (message ID, file path, line, message).
+        violations: dict[tuple[str, str, int, str], Any] = {}
         for import_node in import_nodes_to_check:
             # Check if this import violates any contracts
-            if self._contract_checker.is_import_violation(import_node, self._contracts_cache):
+            if self._contract_checker.is_import_violation(
+                import_node, self._contracts_cache, imported_prefixes
+            ):
                 if debug:
                     print(f"Debug: Found violation in import node at line {import_node.lineno}")
-                # Report violation at the specific import line
-                self._report_import_violation(import_node)
+                violation = self._get_import_violation(import_node, folder_msg, debug)
+                if violation is not None:
+                    violations.setdefault(violation, import_node)
             elif debug:
                 print(f"Debug: No violation found for import at line {import_node.lineno}")
 
-    def _report_import_violation(self, import_node) -> None:
-        """Report a violation for a specific import node using contract-based logic."""
-        try:
-            # Only report if we have contracts loaded
-            if not self._contracts_cache:
-                return
-
-            # Get the module being imported
-            imported_module = self._contract_checker._extract_imported_module(import_node)
-            if not imported_module:
-                return
+        # Report each violation at the specific import line
+        for (message_id, _, line, violation_msg), import_node in violations.items():
+            self.add_message(message_id, args=(violation_msg,), node=import_node, line=line)
+            if debug:
+                print(f"Debug: Message added successfully for line {line}")
 
-            # Get the current module path
-            current_file = import_node.root().file if hasattr(import_node.root(), "file") else ""
-            current_module = self._module_resolver.get_module_path_from_file(current_file)
+    def _any_violation_message_enabled(self) -> bool:
+        """
+        Whether the message of any broken contract is enabled in pylint's configuration.
 
-            # Handle relative imports
-            imported_module = self._contract_checker._resolve_relative_import(
-                imported_module, import_node, current_module
+        Only the global state is consulted, as per-line state belongs to the file pylint
+        analysed last. Returns True if the contracts can't be inspected.
+        """
+        try:
+            return any(
+                self.linter.is_message_enabled(self._get_message_id(contract))
+                for contract, contract_check in self._contracts_cache.get_contracts_and_checks()
+                if not contract_check.kept
             )
-            if not imported_module:
-                return
+        except (AttributeError, TypeError):
+            return True
+
+    def _get_import_violation(
+        self, import_node, folder_msg: str, debug: bool
+    ) -> tuple[str, str, int, str] | None:
+        """
+        Find the first contract violated by an import node.
+
+        ``folder_msg`` is the folder targeting context appended to the message.
+        Returns (message ID, file path, line, message), or None if no contract is violated.
+        """
+        try:
+            # Only report if we have contracts loaded
+            if not self._contracts_cache:
+                return None
 
-            # Determine folder message for context
-            folder_msg = ""
-            target_folders = self.linter.config.import_linter_target_folders or ()
-            if target_folders:
-                folder_msg = f" (targeting folders: {', '.join(target_folders)})"
+            # Resolved once per node, usually already by is_import_violation
+            resolved_import = self._contract_checker.resolve_import(import_node)
+            if resolved_import is None:
+                return None
+            current_file, current_module, imported_module = resolved_import
 
-            # Create detailed violation message with import path information
-            import_details = f"'{current_module}' imports '{imported_module}'"
+            if debug:
+                print(
+                    f"Debug: _get_import_violation called for "
+                    f"'{current_module}' imports '{imported_module}'"
+                )
 
-            debug = self.linter.config.import_linter_debug
+            # Imports of the same module from the same module share one message
+            pair = (current_module, imported_module)
+            try:
+                pair_violation = self._pair_violations[pair]
+            except KeyError:
+                pair_violation = self._pair_violations[pair] = self._get_pair_violation(
+                    current_module, imported_module, folder_msg, debug
+                )
 
-            if debug:
-                print(f"Debug: _report_import_violation called for {import_details}")
-
-            # Check against actual contracts and report violations
-            for contract, contract_check in self._contracts_cache.get_contracts_and_checks():
-                if not contract_check.kept:
-                    # Use contract checker logic
-                    if self._contract_checker._check_contract_against_import(
-                        contract, contract_check, current_module, imported_module
-                    ):
-                        # Determine the contract type and message ID
-                        contract_type = contract.__class__.__name__
-                        message_id = get_message_id_for_contract_type(contract_type)
-
-                        if debug:
-                            print(f"Debug: Adding message {message_id} for {contract.name}")
-
-                        # Create appropriate violation message
-                        violation_msg = format_violation_message(
-                            contract.name,
-                            message_id,
-                            folder_msg,
-                            f"{import_details} (violates {contract.name})",
-                        )
-
-                        # Report the violation
-                        self.add_message(
-                            message_id,
-                            args=(violation_msg,),
-                            node=import_node,
-                            line=import_node.lineno,
-                        )
-
-                        if debug:
-                            print(
-                                f"Debug: Message added successfully for line {import_node.lineno}"
-                            )
-
-                        # Only report the first matching violation per import
-                        return
+            if pair_violation is not None:
+                message_id, violation_msg = pair_violation
+                return message_id, current_file, import_node.lineno, violation_msg
 
         except (AttributeError, TypeError, ValueError):
             pass  # Silently ignore errors in reporting
 
+        return None
+
+    def _get_pair_violation(
+        self, current_module: str, imported_module: str, folder_msg: str, debug: bool
+    ) -> tuple[str, str] | None:
+        """
+        Find the first contract violated by importing one module from another.
+
+        Returns (message ID, message), or None if no contract is violated.
+        """
+        # Create detailed violation message with import path information
+        import_details = f"'{current_module}' imports '{imported_module}'"
+
+        # Check against actual contracts and report violations
+        for contract, contract_check in self._contracts_cache.get_contracts_and_checks():
+            if not contract_check.kept:
+                # Use contract checker logic
+                if self._contract_checker._check_contract_against_import(
+                    contract, contract_check, current_module, imported_module
+                ):
+                    message_id = self._get_message_id(contract)
+
+                    if debug:
+                        print(f"Debug: Adding message {message_id} for {contract.name}")
+
+                    # Create appropriate violation message
+                    violation_msg = format_violation_message(
+                        contract.name,
+                        message_id,
+                        folder_msg,
+                        f"{import_details} (violates {contract.name})",
+                    )
+
+                    # Only report the first matching violation per import
+                    return message_id, violation_msg
+
+        return None
+
+    def _get_message_id(self, contract) -> str:
+        """Return the message ID for a contract, looked up once per contract class."""
+        contract_class = type(contract)
+        try:
+            return self._message_ids[contract_class]
+        except KeyError:
+            message_id = get_message_id_for_contract_type(contract_class.__name__)
+            self._message_ids[contract_class] = message_id
+            return message_id
+
     # Visitor methods for collecting nodes
     def visit_module(self, node) -> None:
         """Visit module nodes - capture first one for error reporting and track analyzed files."""
         if self._first_module_node is None:
             self._first_module_node = node
 
-        # Track the file path for folder-based filtering and store module nodes
+        # Track the file path for folder-based filtering
         if hasattr(node, "file") and node.file:
             self._analyzed_files.add(node.file)
-            self._module_nodes[node.file] = node
 
     def visit_import(self, node) -> None:
         """Visit import nodes to track them for line-specific reporting."""
-        self._import_nodes.append(node)
+        self._track_import_node(node)
 
     def visit_importfrom(self, node) -> None:
         """Visit from-import nodes to track them for line-specific reporting."""
+        self._track_import_node(node)
+
+    def _track_import_node(self, node) -> None:
+        """Store an import node, also bucketed by its file so fast mode needn't walk the AST."""
+        if self._contracts_checked:
+            # Nothing is checked after the first close(), so don't hold on to the node
+            return
         self._import_nodes.append(node)
+        file_path = getattr(node.root(), "file", None)
+        if file_path:
+            self._import_nodes_by_file.setdefault(file_path, []).append(node)
 
     # Backward compatibility methods for tests
     def _get_module_path_from_file(self, file_path: str) -> str:
@@ -1,10 +1,144 @@
 """Contract checking and violation detection logic."""
 
-from typing import Union, Optional
+import sys
+import traceback
+from dataclasses import dataclass
+from typing import Any, Iterator, Literal, Union, Optional
 from importlinter.application.sentinels import NotSupplied
 from importlinter.application.constants import IMPORT_CONTRACT_ERROR
 from .violation_matcher import ViolationMatcher
 
+# Whether import-linter's settings have been configured by this plugin yet
+_configured = False
+
+
+def _ensure_configured() -> None:
+    """
+    Configure import-linter's settings with the default adapters, once per process.
+
+    Deferred until a report is actually built, so that loading the plugin (for example
+    in runs where it ends up checking nothing) doesn't pay for importing the adapters.
+    If a host application has already configured a graph builder, its settings are
+    left as they are rather than overwritten with the defaults.
+    """
+    global _configured
+    if not _configured:
+        from importlinter.application.app_config import settings
+
+        try:
+            settings.GRAPH_BUILDER
+        except KeyError:
+            from importlinter.configuration import configure
+
+            configure()
+        _configured = True
+
+
+def _build_report(
+    config_filename: Optional[str],
+    limit_to_contracts: tuple[str, ...],
+    cache_dir: Union[str, None, type[NotSupplied]],
+    show_timings: bool,
+    verbose: bool,
+):
+    """Read the configuration and build the import-linter report."""
+    _ensure_configured()
+    from importlinter.application.use_cases import (
+        _register_contract_types,
+        create_report,
+        read_user_options,
+    )
+
+    user_options = read_user_options(config_filename=config_filename)
+    _register_contract_types(user_options)
+
+    report = create_report(
+        user_options=user_options,
+        limit_to_contracts=limit_to_contracts,
+        cache_dir=cache_dir,
+        show_timings=show_timings,
+        verbose=verbose,
+    )
+    return user_options, report
+
+
+@dataclass(frozen=True)
+class _ViolationLinks:
+    """The unique (importer, imported) links of a contract check's invalid chains."""
+
+    links: tuple[tuple[str, str], ...]
+    link_set: frozenset[tuple[str, str]]
+    # Importers by imported module, and the distinct lengths of those imported modules
+    importers_by_imported: dict[str, tuple[str, ...]]
+    imported_lengths: tuple[int, ...]
+
+    @classmethod
+    def from_links(cls, links: Iterator[tuple[str, str]]) -> "_ViolationLinks":
+        # Interned, like resolved imports, so lookups against them compare by identity
+        unique_links = tuple(
+            dict.fromkeys(
+                (sys.intern(importer), sys.intern(imported)) for importer, imported in links
+            )
+        )
+        importers_by_imported: dict[str, list[str]] = {}
+        for importer, imported in unique_links:
+            importers_by_imported.setdefault(imported, []).append(importer)
+        return cls(
+            links=unique_links,
+            link_set=frozenset(unique_links),
+            importers_by_imported={
+                imported: tuple(importers) for imported, importers in importers_by_imported.items()
+            },
+            imported_lengths=tuple(sorted({len(imported) for imported in importers_by_imported})),
+        )
+
+    def iter_candidates(self, imported_module: str) -> Iterator[tuple[str, str]]:
+        """
+        Yield the links whose imported module is a string prefix of ``imported_module``.
+
+        Every matching strategy requires that, so only these links need to be compared,
+        however many violations there are.
+        """
+        for length in self.imported_lengths:
+            if length > len(imported_module):
+                break
+            imported = imported_module[:length]
+            for importer in self.importers_by_imported.get(imported, ()):
+                yield importer, imported
+
+
+@dataclass(frozen=True)
+class _ContractInfo:
+    """The kind of a contract and its module expressions, as strings."""
+
+    kind: Optional[Literal["forbidden", "independence", "whitelist"]]
+    source_modules: tuple[str, ...] = ()
+    forbidden_modules: tuple[str, ...] = ()
+    modules: tuple[str, ...] = ()
+
+
+def _pattern_strings(patterns) -> tuple[str, ...]:
+    """Render module expressions once, so they aren't converted again for every import."""
+    return tuple(str(pattern) for pattern in patterns)
+
+
+def _iter_violation_links(metadata) -> Iterator[tuple[str, str]]:
+    """Yield (importer, imported) for every link in a contract check's invalid chains."""
+    if not metadata:
+        return iter(())
+    return (
+        (link["importer"], link["imported"])
+        for chain_info in metadata.get("invalid_chains", ())
+        for chain in chain_info.get("chains", ())
+        for link in chain
+        if "importer" in link and "imported" in link
+    )
+
+
+def _pattern_prefix(pattern) -> str:
+    """Return the part of a module pattern before its first wildcard."""
+    return str(pattern).split("*", 1)[0]
+
 
 class ContractChecker:
     """Handles contract checking and violation reporting."""
@@ -15,6 +149,65 @@ class ContractChecker:
         self.module_resolver = module_resolver
         self.debug = debug
         self.violation_matcher = ViolationMatcher(debug=debug)
+        # Results of _check_contract_against_import by (id(contract), importer, imported)
+        self._contract_import_cache: dict[tuple[int, str, str], bool] = {}
+        # Violation links by id(contract_check); the check itself is kept alongside so
+        # that its id can't be reused while cached.
+        self._violation_links_cache: dict[int, tuple[Any, _ViolationLinks]] = {}
+        # Contract kinds and patterns by id(contract), kept alongside the contract likewise
+        self._contract_info_cache: dict[int, tuple[Any, _ContractInfo]] = {}
+        # Resolved imports by id(import_node), with the node kept alongside
+        self._resolved_import_cache: dict[int, tuple[Any, Optional[tuple[str, str, str]]]] = {}
+        # Containing package by module, for resolving relative imports
+        self._package_cache: dict[str, str] = {}
+
+    def clear_cache(self) -> None:
+        """Forget contract results computed so far (e.g. between pylint runs)."""
+        self._contract_import_cache.clear()
+        self._violation_links_cache.clear()
+        self._contract_info_cache.clear()
+        self._resolved_import_cache.clear()
+        self._package_cache.clear()
+
+    def _get_contract_info(self, contract) -> _ContractInfo:
+        """Return the kind and module expressions of a contract, resolved once per contract."""
+        try:
+            _, contract_info = self._contract_info_cache[id(contract)]
+        except KeyError:
+            contract_info = self._build_contract_info(contract)
+            self._contract_info_cache[id(contract)] = (contract, contract_info)
+        return contract_info
+
+    def _build_contract_info(self, contract) -> _ContractInfo:
+        """Work out which kind of contract this is from the attributes it has."""
+        if self._is_forbidden_contract(contract):
+            return _ContractInfo(
+                kind="forbidden",
+                source_modules=_pattern_strings(contract.source_modules),
+                forbidden_modules=_pattern_strings(contract.forbidden_modules),
+            )
+        elif self._is_independence_contract(contract):
+            return _ContractInfo(kind="independence", modules=_pattern_strings(contract.modules))
+        elif self._is_whitelist_contract(contract):
+            return _ContractInfo(
+                kind="whitelist", source_modules=_pattern_strings(contract.source_modules)
+            )
+        return _ContractInfo(kind=None)
+
+    def _get_violation_links(self, contract_check) -> _ViolationLinks:
+        """
+        Return the unique violation links of a contract check's invalid chains.
+
+        The nested metadata is only walked once per contract check.
+        """
+        try:
+            _, violation_links = self._violation_links_cache[id(contract_check)]
+        except KeyError:
+            violation_links = _ViolationLinks.from_links(
+                _iter_violation_links(getattr(contract_check, "metadata", None))
+            )
+            self._violation_links_cache[id(contract_check)] = (contract_check, violation_links)
+        return violation_links
 
     def check_import_contracts(
         self, first_module_node, single_file_mode: bool, target_module_name: Optional[str]
@@ -40,16 +233,10 @@ class ContractChecker:
                 if debug:
                     print("Import-linter: Debug mode enabled")
 
-            # Read user options and register contract types
-            from importlinter.application.use_cases import (
-                _register_contract_types,
-                create_report,
-                read_user_options,
+            user_options, report = _build_report(
+                config_filename, limit_to_contracts, cache_dir, show_timings, verbose
             )
 
-            user_options = read_user_options(config_filename=config_filename)
-            _register_contract_types(user_options)
-
             if verbose:
                 print(f"Import-linter: Found {len(user_options.contracts_options)} contracts")
                 for i, contract_options in enumerate(user_options.contracts_options, 1):
@@ -57,19 +244,10 @@ class ContractChecker:
                     contract_type = contract_options.get("type", "unknown")
                     print(f"Import-linter: Contract {i}: {name} (type: {contract_type})")
 
-            # Create detailed report with optimizations for single-file mode
             if single_file_mode and self.config.import_linter_fast_mode and target_module_name:
                 if verbose:
                     print(f"Import-linter: Fast mode enabled for {target_module_name}")
 
-            report = create_report(
-                user_options=user_options,
-                limit_to_contracts=limit_to_contracts,
-                cache_dir=cache_dir,
-                show_timings=show_timings,
-                verbose=verbose,
-            )
-
             if verbose:
                 print(f"Import-linter: Analysis complete. Found {len(report.contracts)} results")
                 for contract in report.contracts:
@@ -91,8 +269,6 @@ class ContractChecker:
         """Handle errors in contract checking."""
         error_msg = str(error)
         if debug:
-            import traceback
-
             error_msg += f"\nDebug traceback:\n{traceback.format_exc()}"
 
         # This would need to be handled by the calling checker
@@ -102,13 +278,9 @@ class ContractChecker:
     def _handle_unexpected_error(self, error, first_module_node, debug: bool):
         """Handle unexpected errors during contract checking."""
         error_str = str(error)
-        exception_name = type(error).__name__
 
-        if (
-            "NotATopLevelModule" in error_str
-            or exception_name == "NotATopLevelModule"
-            or "grimp.exceptions.NotATopLevelModule" in error_str
-        ):
+        # The qualified grimp.exceptions name is covered by the substring check
+        if type(error).__name__ == "NotATopLevelModule" or "NotATopLevelModule" in error_str:
             if self.config.import_linter_verbose or debug:
                 print(
                     "Import-linter: Skipping analysis due to package structure issues. "
@@ -118,10 +290,8 @@ class ContractChecker:
             # Don't report this as an error since it's likely a project structure issue
             return None
 
-        error_msg = f"Unexpected error: {str(error)}"
+        error_msg = f"Unexpected error: {error_str}"
         if debug:
-            import traceback
-
             error_msg += f"\nDebug traceback:\n{traceback.format_exc()}"
 
         return {"error": IMPORT_CONTRACT_ERROR, "args": (error_msg,), "node": first_module_node}
@@ -134,61 +304,142 @@ class ContractChecker:
             return self.config.import_linter_cache_dir
         return NotSupplied
 
-    def is_import_violation(self, import_node, contracts_cache) -> bool:
-        """Check if an import node violates any contracts using the configured contracts."""
+    def get_imported_module_prefixes(self, contracts_cache) -> Optional[tuple[str, ...]]:
+        """
+        Return prefixes that the imported module of any violating import starts with.
+
+        Every way an import can match a broken contract requires the imported module to
+        match a forbidden or independent module expression, or to start with the imported
+        side of a violation link, so imports of anything else can't be violations.
+        Returns None if the prefixes can't be determined.
+        """
+        prefixes: set[str] = set()
         try:
-            if not contracts_cache:
-                return False
+            for contract, contract_check in contracts_cache.get_contracts_and_checks():
+                if contract_check.kept:
+                    continue
+                contract_info = self._get_contract_info(contract)
+                if contract_info.kind == "forbidden":
+                    prefixes.update(_pattern_prefix(p) for p in contract_info.forbidden_modules)
+                    links = self._get_violation_links(contract_check).links
+                    prefixes.update(imported for _, imported in links)
+                elif contract_info.kind == "independence":
+                    prefixes.update(_pattern_prefix(p) for p in contract_info.modules)
+                elif contract_info.kind == "whitelist":
+                    links = self._get_violation_links(contract_check).links
+                    prefixes.update(imported for _, imported in links)
+        except (AttributeError, TypeError):
+            return None
+        return tuple(prefixes)
 
-            # Get the module being imported
-            imported_module = self._extract_imported_module(import_node)
-            if not imported_module:
-                return False
+    def is_import_violation(
+        self, import_node, contracts_cache, imported_prefixes: Optional[tuple[str, ...]] = None
+    ) -> bool:
+        """
+        Check if an import node violates any contracts using the configured contracts.
 
-            # Get the current module path
-            current_file = import_node.root().file if hasattr(import_node.root(), "file") else ""
-            if not current_file:
+        If ``imported_prefixes`` (see get_imported_module_prefixes) is passed, imports of
+        modules that don't start with any of them are rejected without checking contracts.
+        """
+        try:
+            if not contracts_cache:
                 return False
 
-            current_module = self.module_resolver.get_module_path_from_file(current_file)
-
-            # Handle relative imports
-            imported_module = self._resolve_relative_import(
-                imported_module, import_node, current_module
-            )
-            if not imported_module:
+            resolved_import = self.resolve_import(import_node)
+            if resolved_import is None:
                 return False
+            _, current_module, imported_module = resolved_import
 
-            if self.debug:
-                print(f"Debug: Checking import {current_module} -> {imported_module}")
+            if imported_prefixes is not None and not imported_module.startswith(imported_prefixes):
+                return False
 
             # Check against contracts
-            for contract, contract_check in contracts_cache.get_contracts_and_checks():
-                if not contract_check.kept:
-                    if self.debug:
-                        print(f"Debug: Contract '{contract.name}' is broken, checking violations")
-                        print(f"Debug: Contract check metadata: {contract_check.metadata}")
-
-                    if self._check_contract_against_import(
-                        contract, contract_check, current_module, imported_module
-                    ):
-                        if self.debug:
-                            print(f"Debug: MATCH! {current_module} -> {imported_module}")
-                        return True
-
-            return False
+            if self.debug:
+                return self._matches_broken_contract_debug(
+                    contracts_cache, current_module, imported_module
+                )
+            return self._matches_broken_contract(contracts_cache, current_module, imported_module)
 
         except (AttributeError, TypeError, ValueError) as e:
             if self.debug:
                 print(f"Debug: Exception in is_import_violation: {e}")
             return False
 
+    def resolve_import(self, import_node) -> Optional[tuple[str, str, str]]:
+        """
+        Return (file path, importing module, absolute imported module) for an import node.
+
+        Returns None if the node's file or imported module can't be determined. Memoised
+        per node, as a violating import is resolved again when its message is built.
+        """
+        try:
+            _, resolved_import = self._resolved_import_cache[id(import_node)]
+        except KeyError:
+            resolved_import = self._resolve_import_uncached(import_node)
+            self._resolved_import_cache[id(import_node)] = (import_node, resolved_import)
+        return resolved_import
+
+    def _resolve_import_uncached(self, import_node) -> Optional[tuple[str, str, str]]:
+        """Resolve an import node, without caching."""
+        # Get the module being imported
+        imported_module = self._extract_imported_module(import_node)
+        if not imported_module:
+            return None
+
+        # Get the current module path
+        current_file = getattr(import_node.root(), "file", None)
+        if not current_file:
+            return None
+
+        current_module = self.module_resolver.get_module_path_from_file(current_file)
+
+        # Handle relative imports
+        imported_module = self._resolve_relative_import(
+            imported_module, import_node, current_module
+        )
+        if not imported_module:
+            return None
+
+        # Module names are compared and hashed against violation links and cache keys
+        # for every contract; interned, equal names are usually the same object.
+        return current_file, sys.intern(current_module), sys.intern(imported_module)
+
+    def _matches_broken_contract(
+        self, contracts_cache, current_module: str, imported_module: str
+    ) -> bool:
+        """Check if an import violates any broken contract."""
+        for contract, contract_check in contracts_cache.get_contracts_and_checks():
+            if not contract_check.kept and self._check_contract_against_import(
+                contract, contract_check, current_module, imported_module
+            ):
+                return True
+        return False
+
+    def _matches_broken_contract_debug(
+        self, contracts_cache, current_module: str, imported_module: str
+    ) -> bool:
+        """Check if an import violates any broken contract, printing debug output."""
+        print(f"Debug: Checking import {current_module} -> {imported_module}")
+        for contract, contract_check in contracts_cache.get_contracts_and_checks():
+            if not contract_check.kept:
+                print(f"Debug: Contract '{contract.name}' is broken, checking violations")
+                print(f"Debug: Contract check metadata: {contract_check.metadata}")
+
+                if self._check_contract_against_import(
+                    contract, contract_check, current_module, imported_module
+                ):
+                    print(f"Debug: MATCH! {current_module} -> {imported_module}")
+                    return True
+        return False
+
     def _extract_imported_module(self, import_node) -> Optional[str]:
         """Extract the module name being imported from an import node."""
-        if hasattr(import_node, "modname") and import_node.modname:
-            return import_node.modname
-        elif hasattr(import_node, "names") and import_node.names:
-            return import_node.names[0][0]
+        modname = getattr(import_node, "modname", None)
+        if modname:
+            return modname
+        names = getattr(import_node, "names", None)
+        if names:
+            return names[0][0]
         return None
 
     def _resolve_relative_import(
@@ -198,7 +449,7 @@ class ContractChecker:
         if imported_module.startswith("."):
             # Relative import - resolve based on current module
             if current_module:
-                current_package = ".".join(current_module.split(".")[:-1])
+                current_package = self._get_package(current_module)
                 if current_package:
                     relative_part = imported_module.lstrip(".")
                     if relative_part:
@@ -207,10 +458,10 @@ class ContractChecker:
                         return current_package
                 else:
                     return None
-        elif hasattr(import_node, "level") and import_node.level and import_node.level > 0:
+        elif (getattr(import_node, "level", None) or 0) > 0:
             # This is a from-import with relative level
             if current_module:
-                current_package = ".".join(current_module.split(".")[:-1])
+                current_package = self._get_package(current_module)
                 if current_package:
                     return f"{current_package}.{imported_module}"
                 else:
@@ -218,20 +469,47 @@ class ContractChecker:
 
         return imported_module
 
+    def _get_package(self, module: str) -> str:
+        """Return the package containing a module ("" for a top-level module), memoised."""
+        try:
+            return self._package_cache[module]
+        except KeyError:
+            package = self._package_cache[module] = module.rpartition(".")[0]
+            return package
+
     def _check_contract_against_import(
         self, contract, contract_check, current_module: str, imported_module: str
     ) -> bool:
         """Check if a specific import violates a specific contract."""
+        # Contract checks don't change during a run, and the same import is usually
+        # checked once to detect a violation and again to report it.
+        key = (id(contract), current_module, imported_module)
+        try:
+            return self._contract_import_cache[key]
+        except KeyError:
+            result = self._check_contract_against_import_uncached(
+                contract, contract_check, current_module, imported_module
+            )
+            self._contract_import_cache[key] = result
+            return result
+
+    def _check_contract_against_import_uncached(
+        self, contract, contract_check, current_module: str, imported_module: str
+    ) -> bool:
+        """Check if a specific import violates a specific contract, without caching."""
         try:
-            if self._is_forbidden_contract(contract):
+            contract_info = self._get_contract_info(contract)
+            if contract_info.kind == "forbidden":
                 return self._check_forbidden_contract(
-                    contract, contract_check, current_module, imported_module
+                    contract_info, contract_check, current_module, imported_module
+                )
+            elif contract_info.kind == "independence":
+                return self._check_independence_contract(
+                    contract_info, current_module, imported_module
                 )
-            elif self._is_independence_contract(contract):
-                return self._check_independence_contract(contract, current_module, imported_module)
-            elif self._is_whitelist_contract(contract):
+            elif contract_info.kind == "whitelist":
                 return self._check_whitelist_contract(
-                    contract, contract_check, current_module, imported_module
+                    contract_info, contract_check, current_module, imported_module
                 )
             return False
 
@@ -253,7 +531,11 @@ class ContractChecker:
         return hasattr(contract, "source_modules") and hasattr(contract, "allowed_modules")
 
     def _check_forbidden_contract(
-        self, contract, contract_check, current_module: str, imported_module: str
+        self,
+        contract_info: _ContractInfo,
+        contract_check,
+        current_module: str,
+        imported_module: str,
     ) -> bool:
         """Check forbidden contract violations."""
         # First, check if this specific import matches any violations in metadata
@@ -261,19 +543,19 @@ class ContractChecker:
             return True
 
         # Fallback to pattern matching if no direct violation match
-        return self._check_forbidden_pattern_match(contract, current_module, imported_module)
+        return self._check_forbidden_pattern_match(contract_info, current_module, imported_module)
 
     def _check_independence_contract(
-        self, contract, current_module: str, imported_module: str
+        self, contract_info: _ContractInfo, current_module: str, imported_module: str
     ) -> bool:
         """Check independence contract violations."""
         current_in_group = any(
             self.violation_matcher.module_matches_pattern(current_module, module_pattern)
-            for module_pattern in contract.modules
+            for module_pattern in contract_info.modules
         )
         imported_in_group = any(
             self.violation_matcher.module_matches_pattern(imported_module, module_pattern)
-            for module_pattern in contract.modules
+            for module_pattern in contract_info.modules
         )
 
         if self.debug:
@@ -290,12 +572,16 @@ class ContractChecker:
         )
 
     def _check_whitelist_contract(
-        self, contract, contract_check, current_module: str, imported_module: str
+        self,
+        contract_info: _ContractInfo,
+        contract_check,
+        current_module: str,
+        imported_module: str,
     ) -> bool:
         """Check whitelist contract violations."""
         source_match = any(
             self.violation_matcher.module_matches_pattern(current_module, source_pattern)
-            for source_pattern in contract.source_modules
+            for source_pattern in contract_info.source_modules
         )
 
         if not source_match:
@@ -308,36 +594,32 @@ class ContractChecker:
         self, contract_check, current_module: str, imported_module: str
     ) -> bool:
         """Check if import matches any violations in contract metadata."""
-        if not (hasattr(contract_check, "metadata") and contract_check.metadata):
-            return False
-
-        metadata = contract_check.metadata
-        if "invalid_chains" not in metadata:
-            return False
+        violation_links = self._get_violation_links(contract_check)
+        if (current_module, imported_module) in violation_links.link_set:
+            return True
 
-        for chain_info in metadata["invalid_chains"]:
-            if "chains" in chain_info:
-                for chain in chain_info["chains"]:
-                    for link in chain:
-                        if "importer" in link and "imported" in link:
-                            if self.violation_matcher.matches_violation_link(
-                                link, current_module, imported_module
-                            ):
-                                return True
+        # Fall back to the matcher's looser strategies
+        for violation_importer, violation_imported in violation_links.iter_candidates(
+            imported_module
+        ):
+            if self.violation_matcher.matches_violation(
+                current_module, imported_module, violation_importer, violation_imported
+            ):
+                return True
         return False
 
     def _check_forbidden_pattern_match(
-        self, contract, current_module: str, imported_module: str
+        self, contract_info: _ContractInfo, current_module: str, imported_module: str
     ) -> bool:
         """Check forbidden contract using pattern matching."""
         source_match = any(
             self.violation_matcher.module_matches_pattern(current_module, source_pattern)
-            for source_pattern in contract.source_modules
+            for source_pattern in contract_info.source_modules
         )
 
         forbidden_match = any(
             self.violation_matcher.module_matches_pattern(imported_module, forbidden_pattern)
-            for forbidden_pattern in contract.forbidden_modules
+            for forbidden_pattern in contract_info.forbidden_modules
         )
 
         if self.debug:
@@ -352,36 +634,24 @@ class ContractChecker:
         self, contract_check, current_module: str, imported_module: str
     ) -> bool:
         """Check only explicit violations for whitelist contracts."""
-        if not (hasattr(contract_check, "metadata") and contract_check.metadata):
-            return False
-
-        metadata = contract_check.metadata
-        if "invalid_chains" not in metadata:
-            return False
-
-        for chain_info in metadata["invalid_chains"]:
-            if "chains" in chain_info:
-                for chain in chain_info["chains"]:
-                    for link in chain:
-                        if "importer" in link and "imported" in link:
-                            violation_importer = link["importer"]
-                            violation_imported = link["imported"]
-
-                            if self.debug:
-                                print("Debug: Testing violation match:")
-                                print(f"  current_module={current_module}")
-                                print(f"  imported_module={imported_module}")
-                                print(f"  violation_importer={violation_importer}")
-                                print(f"  violation_imported={violation_imported}")
-
-                            # Check if this is the exact violation
-                            if (
-                                violation_importer == current_module
-                                and imported_module.startswith(violation_imported)
-                            ):
-                                if self.debug:
-                                    print("Debug: EXACT VIOLATION MATCH found!")
-                                return True
+        violation_links = self._get_violation_links(contract_check)
+        for violation_importer, violation_imported in violation_links.iter_candidates(
+            imported_module
+        ):
+            if self.debug:
+                print("Debug: Testing violation match:")
+                print(f"  current_module={current_module}")
+                print(f"  imported_module={imported_module}")
+                print(f"  violation_importer={violation_importer}")
+                print(f"  violation_imported={violation_imported}")
+
+            # Check if this is the exact violation
+            if violation_importer == current_module and imported_module.startswith(
+                violation_imported
+            ):
+                if self.debug:
+                    print("Debug: EXACT VIOLATION MATCH found!")
+                return True
 
         # For whitelist contracts, only flag explicit violations
         return False
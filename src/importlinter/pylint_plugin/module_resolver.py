@@ -3,6 +3,23 @@
 import os
 from typing import Optional
 
+_DOMAINS_PATTERN = "domains/"
+
+# Whether paths compare case-insensitively here (Windows), as relpath() does via normcase()
+_CASE_INSENSITIVE_PATHS = os.path.normcase("A") == "a"
+
+
+def _needs_normalising(path: str) -> bool:
+    """Whether os.path.normpath() could change a relative path ("a//b", "./a", "a/../b", "a/")."""
+    sep = os.sep
+    return (
+        path.startswith((".", sep))
+        or path.endswith(sep)
+        or sep + sep in path
+        or sep + "." in path
+        or (os.altsep is not None and os.altsep in path)
+    )
+
 
 class ModulePathResolver:
     """Resolves file paths to proper module paths respecting PYTHONPATH and project structure."""
@@ -11,18 +28,93 @@ class ModulePathResolver:
         """Initialize the resolver with configuration."""
         self.config = config
         self.debug = debug
+        self._module_path_cache: dict[str, str] = {}
+        self._relative_path_cache: dict[str, str] = {}
+        self._cwd: Optional[str] = None
+        # (folder, folder + "/", root module) per target folder, built on first use
+        self._target_folder_prefixes: Optional[tuple[tuple[str, str, str], ...]] = None
+        # (entry, entry + "/") per PYTHONPATH entry relative to cwd, built on first use
+        self._pythonpath_prefixes: Optional[tuple[tuple[str, str], ...]] = None
+        self._strategies = (
+            self._try_domains_pattern,
+            self._try_pythonpath_resolution,
+            self._try_target_folder_resolution,
+            self._fallback_resolution,
+        )
+
+    def clear_cache(self) -> None:
+        """Forget module paths resolved so far (e.g. between pylint runs)."""
+        self._module_path_cache.clear()
+        self._relative_path_cache.clear()
+        self._cwd = None
+        self._target_folder_prefixes = None
+        self._pythonpath_prefixes = None
+
+    def _get_cwd(self) -> str:
+        """Return the working directory, only asking the OS for it once per run."""
+        if self._cwd is None:
+            self._cwd = os.getcwd()
+        return self._cwd
+
+    def get_relative_path(self, file_path: str) -> str:
+        """Return a file path relative to the working directory."""
+        try:
+            return self._relative_path_cache[file_path]
+        except KeyError:
+            rel_path = self._relative_path_cache[file_path] = self._make_relative(file_path)
+            return rel_path
+
+    def _make_relative(self, file_path: str) -> str:
+        """
+        Make a file path relative to the working directory, without caching.
+
+        Files under the working directory, which is almost all of them, just have the
+        directory prefix stripped (compared case-insensitively where the OS does, e.g. a
+        differently cased drive letter); anything relpath() would also normalise goes through it.
+        """
+        cwd = self._get_cwd()
+        cwd_prefix = cwd if cwd.endswith(os.sep) else cwd + os.sep
+        if file_path.startswith(cwd_prefix) or (
+            _CASE_INSENSITIVE_PATHS
+            and os.path.normcase(file_path[: len(cwd_prefix)]) == os.path.normcase(cwd_prefix)
+        ):
+            rel_path = file_path[len(cwd_prefix) :]
+            if rel_path and not _needs_normalising(rel_path):
+                return rel_path
+        return os.path.relpath(file_path, cwd)
+
+    def _get_target_folder_prefixes(self) -> tuple[tuple[str, str, str], ...]:
+        """Return the target folder prefix table, building it from the configuration once."""
+        if self._target_folder_prefixes is None:
+            target_folders = getattr(self.config, "import_linter_target_folders", ()) or ()
+            self._target_folder_prefixes = tuple(
+                (folder, folder + "/", folder.split("/")[-1]) for folder in target_folders
+            )
+        return self._target_folder_prefixes
 
     def get_module_path_from_file(self, file_path: str) -> str:
         """Convert file path to proper module path respecting PYTHONPATH."""
         if not file_path:
             return ""
 
-        target_folders = getattr(self.config, "import_linter_target_folders", ()) or ()
+        # The inputs (cwd, PYTHONPATH, target folders) are fixed during a run, so resolve
+        # each file only once rather than once per import node.
+        try:
+            return self._module_path_cache[file_path]
+        except KeyError:
+            module_path = self._resolve_module_path(file_path)
+            self._module_path_cache[file_path] = module_path
+            return module_path
+
+    def _resolve_module_path(self, file_path: str) -> str:
+        """Resolve a file path to a module path, without caching."""
+        target_folder_prefixes = self._get_target_folder_prefixes()
 
         # Get relative path from workspace root
-        rel_path = os.path.relpath(file_path, os.getcwd())
+        rel_path = self.get_relative_path(file_path)
 
         if self.debug:
+            target_folders = tuple(folder for folder, _, _ in target_folder_prefixes)
             print(f"Debug: _get_module_path_from_file: file_path={file_path}")
             print(f"Debug: _get_module_path_from_file: rel_path={rel_path}")
             print(f"Debug: _get_module_path_from_file: target_folders={target_folders}")
@@ -30,28 +122,21 @@ class ModulePathResolver:
         # Remove file extension and handle __init__.py
         if rel_path.endswith("/__init__.py"):
             rel_path = rel_path[:-12]  # Remove "/__init__.py"
-        elif rel_path.endswith(".py"):
-            rel_path = rel_path[:-3]  # Remove ".py"
+        else:
+            rel_path = rel_path.removesuffix(".py")
 
         # Try different resolution strategies in order of priority
-        strategies = [
-            self._try_domains_pattern,
-            self._try_pythonpath_resolution,
-            self._try_target_folder_resolution,
-            self._fallback_resolution,
-        ]
-
-        for strategy in strategies:
-            result = strategy(rel_path, target_folders)
+        for strategy in self._strategies:
+            result = strategy(rel_path, target_folder_prefixes)
             if result is not None:
                 return result
 
         # Final fallback
         return rel_path.replace("/", ".")
 
-    def _try_domains_pattern(self, rel_path: str, target_folders) -> Optional[str]:
+    def _try_domains_pattern(self, rel_path: str, target_folder_prefixes) -> Optional[str]:
         """Try to resolve using domains pattern structure."""
-        domains_pattern = "domains/"
+        domains_pattern = _DOMAINS_PATTERN
 
         if self.debug:
             print(f"Debug: checking domains pattern on rel_path={rel_path}")
@@ -85,17 +170,30 @@ class ModulePathResolver:
                 print("Debug: not enough parts in domains path")
             return None
 
-    def _try_pythonpath_resolution(self, rel_path: str, target_folders) -> Optional[str]:
+    def _try_pythonpath_resolution(self, rel_path: str, target_folder_prefixes) -> Optional[str]:
         """Try to resolve using PYTHONPATH entries."""
-        pythonpath_entries = self._get_all_pythonpath_entries()
-
-        for pythonpath_entry in pythonpath_entries:
-            result = self._resolve_with_pythonpath_entry(rel_path, pythonpath_entry)
+        for pythonpath_entry, pythonpath_prefix in self._get_pythonpath_prefixes():
+            result = self._resolve_with_pythonpath_entry(
+                rel_path, pythonpath_entry, pythonpath_prefix
+            )
             if result is not None:
                 return result
 
         return None
 
+    def _get_pythonpath_prefixes(self) -> tuple[tuple[str, str], ...]:
+        """
+        Return the PYTHONPATH prefix table.
+
+        The configured entries, the environment and the working directory don't change once
+        the checker has been opened, so they are only normalised on first use.
+        """
+        if self._pythonpath_prefixes is None:
+            self._pythonpath_prefixes = tuple(
+                (entry, entry + "/") for entry in self._get_all_pythonpath_entries() if entry
+            )
+        return self._pythonpath_prefixes
+
     def _get_all_pythonpath_entries(self) -> list[str]:
         """Get all PYTHONPATH entries as relative paths."""
         configured_pythonpath = getattr(self.config, "import_linter_pythonpath", ()) or ()
@@ -122,23 +220,21 @@ class ModulePathResolver:
 
     def _convert_to_relative_path(self, path_entry: str) -> str:
         """Convert a path entry to relative path from current working directory."""
+        cwd = self._get_cwd()
         if os.path.isabs(path_entry):
-            return os.path.relpath(path_entry, os.getcwd())
+            return os.path.relpath(path_entry, cwd)
 
         # For relative paths, convert to absolute then back to relative for consistency
         abs_path = os.path.abspath(path_entry)
-        return os.path.relpath(abs_path, os.getcwd())
+        return os.path.relpath(abs_path, cwd)
 
     def _resolve_with_pythonpath_entry(
-        self, rel_path: str, pythonpath_entry: str
+        self, rel_path: str, pythonpath_entry: str, pythonpath_prefix: str
     ) -> Optional[str]:
         """Try to resolve module path using a specific PYTHONPATH entry."""
-        if not pythonpath_entry or not rel_path.startswith(pythonpath_entry):
-            return None
-
-        if rel_path.startswith(pythonpath_entry + "/"):
+        if rel_path.startswith(pythonpath_prefix):
             # Remove the PYTHONPATH prefix to get module path
-            module_path = rel_path[len(pythonpath_entry) + 1 :]
+            module_path = rel_path[len(pythonpath_prefix) :]
             result = module_path.replace("/", ".")
             if self.debug:
                 print(f"Debug: PYTHONPATH result={result} (using entry: {pythonpath_entry})")
@@ -151,24 +247,29 @@ class ModulePathResolver:
 
         return None
 
-    def _try_target_folder_resolution(self, rel_path: str, target_folders) -> Optional[str]:
+    def _try_target_folder_resolution(
+        self, rel_path: str, target_folder_prefixes
+    ) -> Optional[str]:
         """Try to resolve using target folders."""
-        for target_folder in target_folders:
-            result = self._resolve_with_target_folder(rel_path, target_folder)
+        for target_folder, target_prefix, root_module in target_folder_prefixes:
+            result = self._resolve_with_target_folder(
+                rel_path, target_folder, target_prefix, root_module
+            )
             if result is not None:
                 return result
         return None
 
-    def _resolve_with_target_folder(self, rel_path: str, target_folder: str) -> Optional[str]:
+    def _resolve_with_target_folder(
+        self, rel_path: str, target_folder: str, target_prefix: str, root_module: str
+    ) -> Optional[str]:
         """Try to resolve module path using a specific target folder."""
-        if rel_path.startswith(target_folder + "/"):
+        if rel_path.startswith(target_prefix):
             if self.debug:
                 print(f"Debug: checking target_folder={target_folder}")
 
             # If no PYTHONPATH match, use target folder logic as fallback
-            module_path = rel_path[len(target_folder) + 1 :]
-            # Use the last part of target folder as root module
-            root_module = target_folder.split("/")[-1]
+            module_path = rel_path[len(target_prefix) :]
+            # The last part of the target folder is the root module
             result = f"{root_module}.{module_path}" if module_path else root_module
             result = result.replace("/", ".")
 
@@ -177,14 +278,13 @@ class ModulePathResolver:
             return result
         elif rel_path == target_folder:
             # File is exactly at the target folder root
-            root_module = target_folder.split("/")[-1]
             if self.debug:
                 print(f"Debug: root target folder result={root_module}")
             return root_module
 
         return None
 
-    def _fallback_resolution(self, rel_path: str, target_folders) -> str:
+    def _fallback_resolution(self, rel_path: str, target_folder_prefixes) -> str:
         """Fallback resolution strategy."""
         result = rel_path.replace("/", ".")
         if self.debug:
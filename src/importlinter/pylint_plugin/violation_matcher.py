@@ -1,6 +1,28 @@
 """Contract violation detection and matching utilities."""
 
-from typing import Dict, Any
+import re
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+
+@lru_cache(maxsize=None)
+def _compile_module_pattern(pattern_str: str) -> tuple[Optional["re.Pattern[str]"], str]:
+    """
+    Prepare a module pattern for matching; patterns come from a finite configuration.
+
+    Returns the compiled regex for wildcard patterns, or None and the pattern's
+    child prefix ("pattern.") for plain module names.
+    """
+    if "*" not in pattern_str:
+        return None, pattern_str + "."
+
+    if "**" in pattern_str:
+        # Recursive wildcard - replace ** with .* for regex
+        regex_pattern = pattern_str.replace("**", ".*")
+    else:
+        # Single wildcard - replace * with [^.]* (match anything except dots)
+        regex_pattern = pattern_str.replace("*", "[^.]*")
+    return re.compile(f"^{regex_pattern}$"), ""
 
 
 class ViolationMatcher:
@@ -14,9 +36,18 @@ class ViolationMatcher:
         self, link: Dict[str, Any], current_module: str, imported_module: str
     ) -> bool:
         """Check if an import matches a specific violation link."""
-        violation_importer = link["importer"]
-        violation_imported = link["imported"]
+        return self.matches_violation(
+            current_module, imported_module, link["importer"], link["imported"]
+        )
 
+    def matches_violation(
+        self,
+        current_module: str,
+        imported_module: str,
+        violation_importer: str,
+        violation_imported: str,
+    ) -> bool:
+        """Check if an import matches a violation's importer and imported modules."""
         if self.debug:
             print("Debug: Testing violation match:")
             print(f"  current_module={current_module}")
@@ -24,154 +55,47 @@ class ViolationMatcher:
             print(f"  violation_importer={violation_importer}")
             print(f"  violation_imported={violation_imported}")
 
-        # Try multiple matching strategies
-        return (
-            self._exact_match(
-                current_module, imported_module, violation_importer, violation_imported
-            )
-            or self._suffix_match(
-                current_module, imported_module, violation_importer, violation_imported
-            )
-            or self._prefix_match(
-                current_module, imported_module, violation_importer, violation_imported
-            )
-            or self._module_prefix_match(
-                current_module, imported_module, violation_importer, violation_imported
-            )
-            or self._contains_match(
-                current_module, imported_module, violation_importer, violation_imported
-            )
-            or self._flexible_suffix_match(
-                current_module, imported_module, violation_importer, violation_imported
-            )
-        )
+        # Every strategy needs the imported module to start with the violation's one.
+        if not imported_module.startswith(violation_imported):
+            return False
+
+        if violation_importer in current_module:
+            # Exact, prefix (current module ends with the importer) and contains matches
+            match = "CONTAINS"
+        elif violation_importer.endswith(current_module):
+            # The dotted suffix is told apart by the character before it, not a second scan
+            dot_index = len(violation_importer) - len(current_module) - 1
+            if dot_index >= 0 and violation_importer[dot_index] == ".":
+                match = "FLEXIBLE SUFFIX"
+            elif (
+                len(imported_module) == len(violation_imported)
+                or imported_module[len(violation_imported)] == "."
+            ):
+                # A bare suffix needs the imported module itself or one of its children
+                match = "SUFFIX"
+            else:
+                return False
+        else:
+            return False
 
-    def _exact_match(
-        self,
-        current_module: str,
-        imported_module: str,
-        violation_importer: str,
-        violation_imported: str,
-    ) -> bool:
-        """Check exact match between modules."""
-        if current_module == violation_importer and imported_module == violation_imported:
-            if self.debug:
-                print(f"Debug: EXACT MATCH found! {current_module} -> {imported_module}")
-            return True
-        return False
-
-    def _suffix_match(
-        self,
-        current_module: str,
-        imported_module: str,
-        violation_importer: str,
-        violation_imported: str,
-    ) -> bool:
-        """Check if current module is suffix of violation importer."""
-        if violation_importer.endswith(current_module) and imported_module == violation_imported:
-            if self.debug:
-                print(
-                    f"Debug: SUFFIX MATCH found! {current_module} "
-                    f"matches {violation_importer} -> {imported_module}"
-                )
-            return True
-        return False
-
-    def _prefix_match(
-        self,
-        current_module: str,
-        imported_module: str,
-        violation_importer: str,
-        violation_imported: str,
-    ) -> bool:
-        """Check if current module is prefix of violation importer."""
-        if current_module.endswith(violation_importer) and imported_module == violation_imported:
-            if self.debug:
-                print(
-                    f"Debug: PREFIX MATCH found! {current_module} "
-                    f"matches {violation_importer} -> {imported_module}"
-                )
-            return True
-        return False
-
-    def _module_prefix_match(
-        self,
-        current_module: str,
-        imported_module: str,
-        violation_importer: str,
-        violation_imported: str,
-    ) -> bool:
-        """Check if imported module starts with violation imported."""
-        if violation_importer.endswith(current_module) and imported_module.startswith(
-            violation_imported + "."
-        ):
-            if self.debug:
-                print(
-                    f"Debug: IMPORTED MODULE PREFIX MATCH found! "
-                    f"{current_module} matches {violation_importer} -> "
-                    f"{imported_module} starts with {violation_imported}"
-                )
-            return True
-        return False
-
-    def _contains_match(
-        self,
-        current_module: str,
-        imported_module: str,
-        violation_importer: str,
-        violation_imported: str,
-    ) -> bool:
-        """Check if current module contains violation importer."""
-        if violation_importer in current_module and imported_module.startswith(violation_imported):
-            if self.debug:
-                print(
-                    f"Debug: CONTAINS MATCH found! {current_module} "
-                    f"contains {violation_importer} -> {imported_module} "
-                    f"starts with {violation_imported}"
-                )
-            return True
-        return False
-
-    def _flexible_suffix_match(
-        self,
-        current_module: str,
-        imported_module: str,
-        violation_importer: str,
-        violation_imported: str,
-    ) -> bool:
-        """Check flexible suffix match with dot separator."""
-        if violation_importer.endswith(f".{current_module}") and imported_module.startswith(
-            violation_imported
-        ):
-            if self.debug:
-                print(
-                    f"Debug: FLEXIBLE SUFFIX MATCH found! {violation_importer} ends with "
-                    f".{current_module} -> {imported_module} starts with {violation_imported}"
-                )
-            return True
-        return False
+        if self.debug:
+            print(
+                f"Debug: {match} MATCH found! {current_module} matches "
+                f"{violation_importer} -> {imported_module} starts with {violation_imported}"
+            )
+        return True
 
     def module_matches_pattern(self, module: str, pattern) -> bool:
         """Check if a module matches a pattern (with wildcard support)."""
         # Convert pattern to string if it's a ModuleExpression or other object
         pattern_str = str(pattern)
+        regex, child_prefix = _compile_module_pattern(pattern_str)
 
         # Handle wildcard patterns
-        if "**" in pattern_str:
-            # Recursive wildcard - replace ** with .* for regex
-            regex_pattern = pattern_str.replace("**", ".*")
-            import re
-
-            return bool(re.match(f"^{regex_pattern}$", module))
-        elif "*" in pattern_str:
-            # Single wildcard - replace * with [^.]* (match anything except dots)
-            regex_pattern = pattern_str.replace("*", "[^.]*")
-            import re
-
-            return bool(re.match(f"^{regex_pattern}$", module))
-        else:
-            # Exact match or prefix match
-            return module == pattern_str or module.startswith(pattern_str + ".")
+        if regex is not None:
+            return regex.match(module) is not None
+        # Exact match or prefix match
+        return module == pattern_str or module.startswith(child_prefix)
 
     def modules_are_same_domain(self, module1: str, module2: str) -> bool:
         """Check if two modules are in the same domain (for independence contracts)."""
@@ -0,0 +1,44 @@
+import pytest
+
+from importlinter.application.constants import (
+    IMPORT_BOUNDARY_VIOLATION,
+    IMPORT_INDEPENDENCE_VIOLATION,
+    IMPORT_LAYER_VIOLATION,
+    format_violation_message,
+)
+
+
+class TestFormatViolationMessage:
+    @pytest.mark.parametrize(
+        "message_id, expected_base",
+        [
+            (IMPORT_BOUNDARY_VIOLATION, "Forbidden import detected - violates 'My rule' rule"),
+            (IMPORT_LAYER_VIOLATION, "Layer boundary violated - violates 'My rule' rule"),
+            (
+                IMPORT_INDEPENDENCE_VIOLATION,
+                "Module independence violated - violates 'My rule' rule",
+            ),
+            ("unknown-message-id", "Contract validation failed for 'My rule' rule"),
+        ],
+    )
+    def test_base_message(self, message_id, expected_base):
+        result = format_violation_message("My rule", message_id)
+
+        assert result == f"{expected_base}. Run 'lint-imports --verbose' for details."
+
+    def test_includes_details_and_folder_info(self):
+        result = format_violation_message(
+            "My rule", IMPORT_LAYER_VIOLATION, " (folders: src)", "'a' imports 'b'"
+        )
+
+        assert result == (
+            "Layer boundary violated - violates 'My rule' rule: 'a' imports 'b' (folders: src). "
+            "Run 'lint-imports --verbose' for details."
+        )
+
+    def test_contract_name_with_braces_is_not_interpolated(self):
+        result = format_violation_message("{contract_name} {0}", IMPORT_BOUNDARY_VIOLATION)
+
+        assert result.startswith(
+            "Forbidden import detected - violates '{contract_name} {0}' rule."
+        )
@@ -0,0 +1,107 @@
+import json
+from dataclasses import dataclass
+
+from grimp.adaptors.graph import ImportGraph
+
+from importlinter.application.constants import IMPORT_CONTRACT_VIOLATION
+from importlinter.application.formatters import format_report_as_json
+from importlinter.application.ports.reporting import Report
+from importlinter.domain.contract import ContractCheck
+from importlinter.domain.imports import Module
+from tests.helpers.contracts import AlwaysFailsContract, AlwaysPassesContract
+
+
+@dataclass
+class _Chain:
+    modules: tuple
+    line_number: int
+
+
+def _build_report(*contracts_and_checks) -> Report:
+    graph = ImportGraph()
+    graph.add_module("mypackage")
+    report = Report(graph=graph, show_timings=False, graph_building_duration=0)
+    for contract, check in contracts_and_checks:
+        report.add_contract_check(contract, check, duration=0)
+    return report
+
+
+def _build_contract(contract_class, name):
+    return contract_class(name=name, session_options={}, contract_options={})
+
+
+class TestFormatReportAsJson:
+    def test_all_contracts_kept(self):
+        report = _build_report(
+            (_build_contract(AlwaysPassesContract, "Contract one"), ContractCheck(kept=True)),
+            (_build_contract(AlwaysPassesContract, "Contract two"), ContractCheck(kept=True)),
+        )
+
+        result = json.loads(format_report_as_json(report))
+
+        assert result["summary"] == {
+            "analyzed_files": 0,
+            "dependencies": 0,
+            "contracts_total": 2,
+            "contracts_kept": 2,
+            "contracts_broken": 0,
+            "has_violations": False,
+        }
+        assert result["violations"] == []
+        assert result["contracts"] == [
+            {"name": "Contract one", "type": "AlwaysPassesContract", "kept": True},
+            {"name": "Contract two", "type": "AlwaysPassesContract", "kept": True},
+        ]
+
+    def test_broken_contract_reports_violation(self):
+        invalid_chains = [{"upstream_module": "mypackage.a", "downstream_module": "mypackage.b"}]
+        report = _build_report(
+            (_build_contract(AlwaysPassesContract, "Kept"), ContractCheck(kept=True)),
+            (
+                _build_contract(AlwaysFailsContract, "Broken"),
+                ContractCheck(kept=False, metadata={"invalid_chains": invalid_chains}),
+            ),
+        )
+
+        result = json.loads(format_report_as_json(report, folder_info=" (folders: src)"))
+
+        assert result["summary"]["contracts_total"] == 2
+        assert result["summary"]["contracts_kept"] == 1
+        assert result["summary"]["contracts_broken"] == 1
+        assert result["summary"]["has_violations"] is True
+        [violation] = result["violations"]
+        assert violation["symbol"] == IMPORT_CONTRACT_VIOLATION
+        assert violation["contract_name"] == "Broken"
+        assert violation["contract_type"] == "AlwaysFailsContract"
+        assert violation["message"].endswith(
+            " (folders: src). Run 'lint-imports --verbose' for details."
+        )
+        assert violation["details"] == [
+            {"import_chain": str(invalid_chains[0]), "line_number": None}
+        ]
+        assert result["contracts"][1]["violation"] == violation
+
+    def test_chain_with_modules_is_joined(self):
+        chain = _Chain(modules=(Module("mypackage.a"), "mypackage.b"), line_number=3)
+        report = _build_report(
+            (
+                _build_contract(AlwaysFailsContract, "Broken"),
+                ContractCheck(kept=False, metadata={"invalid_chains": [chain]}),
+            ),
+        )
+
+        result = json.loads(format_report_as_json(report))
+
+        assert result["violations"][0]["details"] == [
+            {"import_chain": "mypackage.a -> mypackage.b", "line_number": 3}
+        ]
+
+    def test_non_ascii_is_escaped(self):
+        report = _build_report(
+            (_build_contract(AlwaysPassesContract, "Contrat café"), ContractCheck(kept=True)),
+        )
+
+        output = format_report_as_json(report)
+
+        assert "Contrat caf\\u00e9" in output
+        assert json.loads(output)["contracts"][0]["name"] == "Contrat café"
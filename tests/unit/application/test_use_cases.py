@@ -8,7 +8,13 @@ from grimp.adaptors.graph import ImportGraph
 
 from importlinter.application.app_config import settings
 from importlinter.application.ports.building import GraphBuilder
-from importlinter.application.use_cases import FAILURE, SUCCESS, create_report, lint_imports
+from importlinter.application.use_cases import (
+    FAILURE,
+    SUCCESS,
+    _register_contract_types,
+    create_report,
+    lint_imports,
+)
 from importlinter.application.user_options import UserOptions
 from tests.adapters.building import FakeGraphBuilder
 from tests.adapters.printing import FakePrinter
@@ -600,6 +606,35 @@ class TestGraphCopying:
 
         assert result == SUCCESS
 
+    def test_report_graph_is_not_mutated_by_contracts(self):
+        session_options = {
+            "root_packages": ["mypackage"],
+            "contract_types": ["mutation_check: tests.helpers.contracts.MutationCheckContract"],
+        }
+        user_options = UserOptions(
+            session_options=session_options,
+            contracts_options=[
+                {
+                    "type": "mutation_check",
+                    "name": "Contract one",
+                    "number_of_modules": "1",
+                    "number_of_imports": "0",
+                },
+            ],
+        )
+        settings.configure(
+            GRAPH_BUILDER=FakeGraphBuilder(), PRINTER=FakePrinter(), TIMER=FakeTimer()
+        )
+        graph = ImportGraph()
+        graph.add_module("mypackage")
+        settings.GRAPH_BUILDER.inject_graph(graph)
+        _register_contract_types(user_options)
+
+        report = create_report(user_options, cache_dir=None)
+
+        assert report.graph.modules == {"mypackage"}
+        assert report.graph.count_imports() == 0
+
 
 class TestCreateReport:
     @pytest.mark.parametrize(
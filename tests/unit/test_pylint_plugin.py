@@ -5,12 +5,24 @@ These tests ensure that the pylint plugin correctly integrates with import-linte
 and properly detects contract violations at the line level.
 """
 
+import os
+import sys
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import astroid
 import pytest
 
-from importlinter.application.constants import IMPORT_BOUNDARY_VIOLATION
-from importlinter.pylint_plugin import ImportLinterChecker, register
+from importlinter.application.app_config import settings
+from importlinter.application.constants import IMPORT_BOUNDARY_VIOLATION, IMPORT_CONTRACT_ERROR
+from importlinter.domain.contract import ContractCheck
+from importlinter.pylint_plugin import (
+    ImportLinterChecker,
+    checker,
+    contract_checker,
+    module_resolver,
+    register,
+)
 
 
 class TestImportLinterChecker:
@@ -41,7 +53,6 @@ class TestImportLinterChecker:
         assert self.checker._contracts_checked is False
         assert self.checker._first_module_node is None
         assert self.checker._analyzed_files == set()
-        assert self.checker._module_nodes == {}
         assert self.checker._import_nodes == []
         assert self.checker._contracts_cache is None
 
@@ -67,6 +78,32 @@ class TestImportLinterChecker:
 
             mock_path.insert.assert_called_once_with(0, "/test/path")
 
+    def test_open_prepends_pythonpath_entries_on_every_open(self):
+        """Test that PYTHONPATH entries are prepended once each, and again after a reset."""
+        self.mock_linter.config.import_linter_pythonpath = ("/opt/one", "/opt/two", "/opt/one")
+
+        with (
+            patch("importlinter.pylint_plugin.os.getcwd", return_value="/test/cwd"),
+            patch.object(sys, "path", ["/base"]),
+            patch.dict(os.environ, {"PYTHONPATH": "/existing"}),
+        ):
+            self.checker.open()
+
+            assert sys.path == ["/opt/two", "/opt/one", "/test/cwd", "/base"]
+            assert os.environ["PYTHONPATH"] == os.pathsep.join(
+                ["/opt/two", "/opt/one", "/existing"]
+            )
+
+            # pylint restores sys.path after each run, so a later open() adds the entries
+            # back, without duplicating those still in the environment.
+            sys.path[:] = ["/base"]
+            self.checker.open()
+
+            assert sys.path == ["/opt/two", "/opt/one", "/test/cwd", "/base"]
+            assert os.environ["PYTHONPATH"] == os.pathsep.join(
+                ["/opt/two", "/opt/one", "/existing"]
+            )
+
     def test_visit_module_tracks_files(self):
         """Test that visit_module correctly tracks analyzed files."""
         mock_node = Mock()
@@ -75,7 +112,6 @@ class TestImportLinterChecker:
         self.checker.visit_module(mock_node)
 
         assert "/path/to/test.py" in self.checker._analyzed_files
-        assert self.checker._module_nodes["/path/to/test.py"] == mock_node
         assert self.checker._first_module_node == mock_node
 
     def test_visit_import_tracks_imports(self):
@@ -94,6 +130,172 @@ class TestImportLinterChecker:
 
         assert mock_node in self.checker._import_nodes
 
+    @pytest.mark.parametrize("fast_mode, expected_checked", [(True, False), (False, True)])
+    def test_fast_mode_skips_import_checks_for_file_without_imports(
+        self, fast_mode, expected_checked
+    ):
+        """Test that fast mode builds the report but matches no imports for an import-free file."""
+        self.mock_linter.config.import_linter_fast_mode = fast_mode
+        module_node = Mock()
+        module_node.file = "/path/to/constants.py"
+        self.checker.visit_module(module_node)
+
+        with (
+            patch.object(self.checker, "_check_import_contracts") as mock_check_contracts,
+            patch.object(self.checker, "_check_individual_imports") as mock_check_imports,
+        ):
+            self.checker.close()
+
+        mock_check_contracts.assert_called_once_with()
+        assert mock_check_imports.called is expected_checked
+        assert self.checker._contracts_checked is True
+
+    def test_fast_mode_reports_broken_config_for_file_without_imports(self, tmp_path):
+        """Test that configuration errors are still reported when there are no imports."""
+        config_file = tmp_path / ".importlinter"
+        config_file.write_text("[importlinter]\n[importlinter:contract:one]\nname = One\n")
+        self.mock_linter.config.import_linter_config = str(config_file)
+        self.mock_linter.config.import_linter_fast_mode = True
+        module_node = Mock()
+        module_node.file = "/path/to/constants.py"
+        self.checker.visit_module(module_node)
+
+        self.checker.close()
+
+        self.checker.add_message.assert_called_once()
+        assert self.checker.add_message.call_args[0][0] == IMPORT_CONTRACT_ERROR
+
+    def test_import_nodes_are_released_after_close(self):
+        """Test that import nodes aren't kept once contracts have been checked."""
+        module_node = Mock()
+        module_node.file = "/path/to/target.py"
+        import_node = Mock()
+        import_node.root.return_value.file = "/path/to/target.py"
+        self.checker.visit_module(module_node)
+        self.checker.visit_import(import_node)
+
+        with patch.object(self.checker, "_check_import_contracts"):
+            self.checker.close()
+
+        assert self.checker._import_nodes == []
+        assert self.checker._import_nodes_by_file == {}
+
+        self.checker.visit_importfrom(import_node)
+
+        assert self.checker._import_nodes == []
+
+    def test_message_id_is_looked_up_once_per_contract_class(self):
+        """Test that message IDs are cached by contract class."""
+
+        class ForbiddenContract:
+            pass
+
+        with patch.object(
+            checker,
+            "get_message_id_for_contract_type",
+            wraps=checker.get_message_id_for_contract_type,
+        ) as mock_get_message_id:
+            message_ids = {self.checker._get_message_id(ForbiddenContract()) for _ in range(3)}
+
+        assert message_ids == {IMPORT_BOUNDARY_VIOLATION}
+        mock_get_message_id.assert_called_once_with("ForbiddenContract")
+
+    def test_violation_is_worked_out_once_per_module_pair(self):
+        """Test that imports of one module from the same module share a violation message."""
+        contract = SimpleNamespace(name="Forbidden")
+        self.checker._contracts_cache = Mock()
+        self.checker._contracts_cache.get_contracts_and_checks.return_value = [
+            (contract, ContractCheck(kept=False, metadata={}))
+        ]
+        import_nodes = [Mock(lineno=3), Mock(lineno=7)]
+        contract_checker_ = self.checker._contract_checker
+
+        with (
+            patch.object(
+                contract_checker_,
+                "resolve_import",
+                return_value=("/path/to/target.py", "target", "forbidden.module"),
+            ),
+            patch.object(contract_checker_, "_check_contract_against_import", return_value=True),
+            patch.object(checker, "format_violation_message", return_value="Message"),
+        ):
+            violations = [
+                self.checker._get_import_violation(import_node, "", False)
+                for import_node in import_nodes
+            ]
+            assert checker.format_violation_message.call_count == 1
+
+        assert [line for _, _, line, _ in violations] == [3, 7]
+        assert self.checker._pair_violations == {
+            ("target", "forbidden.module"): (violations[0][0], "Message")
+        }
+
+    @pytest.mark.parametrize("enabled, expected_checked", [(False, False), (True, True)])
+    def test_imports_are_not_checked_when_violation_messages_are_disabled(
+        self, enabled, expected_checked
+    ):
+        """Test that no import is examined if pylint would drop every violation message."""
+        import_node = Mock(lineno=3)
+        import_node.root.return_value.file = "/path/to/target.py"
+        self.checker.visit_import(import_node)
+        self.checker._contracts_cache = Mock()
+        self.checker._contracts_cache.get_contracts_and_checks.return_value = [
+            (SimpleNamespace(modules=["domains"]), ContractCheck(kept=False, metadata={}))
+        ]
+        self.mock_linter.is_message_enabled.return_value = enabled
+        self.checker._contract_checker.is_import_violation = Mock(return_value=False)
+
+        self.checker._check_individual_imports()
+
+        self.mock_linter.is_message_enabled.assert_called_once_with("import-contract-violation")
+        assert self.checker._contract_checker.is_import_violation.called is expected_checked
+
+    def test_duplicate_violations_are_reported_once(self):
+        """Test that identical violations only go through add_message once."""
+        import_node = Mock(lineno=3)
+        import_node.root.return_value.file = "/path/to/target.py"
+        self.checker.visit_import(import_node)
+        self.checker.visit_import(import_node)
+        self.checker._contracts_cache = Mock()
+        self.checker._contract_checker.is_import_violation = Mock(return_value=True)
+        violation = (IMPORT_BOUNDARY_VIOLATION, "/path/to/target.py", 3, "Violation message")
+
+        with patch.object(self.checker, "_get_import_violation", return_value=violation):
+            self.checker._check_individual_imports()
+
+        self.checker.add_message.assert_called_once_with(
+            IMPORT_BOUNDARY_VIOLATION, args=("Violation message",), node=import_node, line=3
+        )
+
+    def test_fast_mode_only_checks_imports_from_the_analyzed_file(self):
+        """Test that fast mode checks only the import nodes of the single analyzed file."""
+        target_import, other_import = Mock(), Mock()
+        target_import.root.return_value.file = "/path/to/target.py"
+        other_import.root.return_value.file = "/path/to/other.py"
+        module_node = Mock()
+        module_node.file = "/path/to/target.py"
+
+        self.checker.visit_module(module_node)
+        self.checker.visit_import(target_import)
+        self.checker.visit_importfrom(other_import)
+
+        assert self.checker._import_nodes_by_file == {
+            "/path/to/target.py": [target_import],
+            "/path/to/other.py": [other_import],
+        }
+
+        self.mock_linter.config.import_linter_fast_mode = True
+        self.checker._single_file_mode = True
+        self.checker._target_module_name = "target"
+        self.checker._contracts_cache = Mock()
+        self.checker._contract_checker.is_import_violation = Mock(return_value=False)
+
+        self.checker._check_individual_imports()
+
+        self.checker._contract_checker.is_import_violation.assert_called_once_with(
+            target_import, self.checker._contracts_cache, None
+        )
+
 
 class TestModulePathResolution:
     """Test the critical _get_module_path_from_file method that was fixed."""
@@ -168,6 +370,126 @@ class TestModulePathResolution:
 
             assert result == "domains"
 
+    def test_get_module_path_is_resolved_once_per_file(self):
+        """Test that repeated lookups for the same file reuse the first resolution."""
+        resolver = self.checker._module_resolver
+
+        with patch.object(
+            resolver, "_resolve_module_path", return_value="domains.billing.payments"
+        ) as mock_resolve:
+            file_path = "/abs/path/example/domains/billing/payments.py"
+            first = self.checker._get_module_path_from_file(file_path)
+            second = self.checker._get_module_path_from_file(file_path)
+
+        assert first == second == "domains.billing.payments"
+        mock_resolve.assert_called_once_with(file_path)
+
+    def test_close_clears_module_path_cache(self):
+        """Test that closing the checker forgets resolved module paths."""
+        resolver = self.checker._module_resolver
+
+        with patch.object(
+            resolver, "_resolve_module_path", return_value="src.mymodule.test"
+        ) as mock_resolve:
+            self.checker._get_module_path_from_file("/abs/path/src/mymodule/test.py")
+            self.checker.close()
+            self.checker._get_module_path_from_file("/abs/path/src/mymodule/test.py")
+
+        assert mock_resolve.call_count == 2
+
+    def test_pythonpath_entries_are_normalised_once_per_run(self):
+        """Test that PYTHONPATH entries are only read and normalised on first use."""
+        resolver = self.checker._module_resolver
+        cwd = os.getcwd()
+
+        with patch.object(
+            resolver, "_get_all_pythonpath_entries", return_value=["src", "lib/vendor"]
+        ) as mock_entries:
+            assert resolver.get_module_path_from_file(f"{cwd}/src/pkg/a.py") == "pkg.a"
+            assert resolver.get_module_path_from_file(f"{cwd}/lib/vendor/b/__init__.py") == "b"
+            assert resolver.get_module_path_from_file(f"{cwd}/lib/other.py") == "lib.other"
+
+        assert mock_entries.call_count == 1
+
+    def test_relative_paths_share_one_cwd_lookup(self):
+        """Test that relative paths are cached and the cwd is only looked up once per run."""
+        resolver = self.checker._module_resolver
+
+        with patch(
+            "importlinter.pylint_plugin.os.getcwd", return_value="/abs/path"
+        ) as mock_getcwd:
+            assert resolver.get_relative_path("/abs/path/src/a.py") == "src/a.py"
+            assert resolver.get_relative_path("/abs/path/src/b.py") == "src/b.py"
+            assert resolver.get_relative_path("/abs/path/src/a.py") == "src/a.py"
+            assert mock_getcwd.call_count == 1
+
+            resolver.clear_cache()
+            mock_getcwd.return_value = "/abs/path/src"
+
+            assert resolver.get_relative_path("/abs/path/src/a.py") == "a.py"
+
+    @pytest.mark.parametrize(
+        "file_path, expected, expected_relpath_calls",
+        [
+            ("/abs/path/src/a.py", "src/a.py", 0),
+            ("/abs/path/src/../lib/a.py", "lib/a.py", 1),
+            ("/abs/path/src/.hidden/a.py", "src/.hidden/a.py", 1),
+            ("/abs/pathology/a.py", "../pathology/a.py", 1),
+            ("/other/a.py", "../../other/a.py", 1),
+        ],
+    )
+    def test_relative_path_strips_cwd_prefix(self, file_path, expected, expected_relpath_calls):
+        """Test that files under the cwd skip os.path.relpath unless they need normalising."""
+        resolver = self.checker._module_resolver
+
+        with (
+            patch("importlinter.pylint_plugin.os.getcwd", return_value="/abs/path"),
+            patch(
+                "importlinter.pylint_plugin.os.path.relpath", wraps=os.path.relpath
+            ) as mock_relpath,
+        ):
+            assert resolver.get_relative_path(file_path) == expected
+
+        assert mock_relpath.call_count == expected_relpath_calls
+
+    def test_relative_path_strips_differently_cased_cwd_prefix(self):
+        """Test that case-insensitive platforms strip a cwd prefix that differs only in case."""
+        resolver = self.checker._module_resolver
+
+        with (
+            patch.object(module_resolver, "_CASE_INSENSITIVE_PATHS", True),
+            patch("importlinter.pylint_plugin.os.path.normcase", side_effect=str.lower),
+            patch("importlinter.pylint_plugin.os.getcwd", return_value="C:/Abs/Path"),
+            patch("importlinter.pylint_plugin.os.path.relpath") as mock_relpath,
+        ):
+            assert resolver.get_relative_path("c:/abs/path/src/A.py") == "src/A.py"
+
+        mock_relpath.assert_not_called()
+
+    def test_close_picks_up_changed_target_folders(self):
+        """Test that target folders are re-read after the checker is closed."""
+        self.mock_linter.config.import_linter_target_folders = ("src/myproject",)
+
+        with patch("importlinter.pylint_plugin.os.path.relpath") as mock_relpath:
+            mock_relpath.return_value = "src/myproject/domain/service.py"
+
+            assert (
+                self.checker._get_module_path_from_file(
+                    "/abs/path/src/myproject/domain/service.py"
+                )
+                == "myproject.domain.service"
+            )
+
+            self.checker.close()
+            self.mock_linter.config.import_linter_target_folders = ("src/myproject/domain",)
+
+            assert (
+                self.checker._get_module_path_from_file(
+                    "/abs/path/src/myproject/domain/service.py"
+                )
+                == "domain.service"
+            )
+
 
 class TestContractFolderLogic:
     """Test the _should_check_contracts method."""
@@ -204,6 +526,54 @@ class TestContractFolderLogic:
 
             assert result is False
 
+    def test_should_check_contracts_with_several_folders(self):
+        """Test that any target folder can match, and exclusions win over targets."""
+        self.mock_linter.config.import_linter_target_folders = ("lib/", "src/")
+        self.mock_linter.config.import_linter_exclude_folders = ("docs/", "src/legacy")
+
+        with patch("importlinter.pylint_plugin.os.path.relpath") as mock_relpath:
+            self.checker._analyzed_files.add("/abs/path/src/legacy/test.py")
+            mock_relpath.return_value = "src/legacy/test.py"
+            assert self.checker._should_check_contracts() is False
+
+            self.checker._analyzed_files.add("/abs/path/src/test.py")
+            mock_relpath.side_effect = lambda path, start: path[len("/abs/path/") :]
+            assert self.checker._should_check_contracts() is True
+
+    @pytest.mark.parametrize(
+        "rel_path, expected",
+        [
+            ("src/api/views.py", True),
+            ("src/core/models.py", True),
+            ("src/core/legacy/models.py", False),
+            ("tests/test_views.py", False),
+        ],
+    )
+    def test_file_in_targets(self, rel_path, expected):
+        """Test that a single file is checked against target and excluded folders."""
+        self.mock_linter.config.import_linter_target_folders = ["src/api", "src/core"]
+        self.mock_linter.config.import_linter_exclude_folders = ["src/core/legacy"]
+
+        with patch("importlinter.pylint_plugin.os.path.relpath", return_value=rel_path):
+            assert self.checker._file_in_targets(f"/abs/path/{rel_path}") is expected
+
+        assert self.checker._folder_prefixes == (("src/api", "src/core"), ("src/core/legacy",))
+
+    def test_file_in_targets_is_decided_once_per_file(self):
+        """Test that the folder decision for a file is reused until the checker closes."""
+        self.mock_linter.config.import_linter_target_folders = ("src/",)
+        self.mock_linter.config.import_linter_exclude_folders = ()
+        self.checker._analyzed_files.add("/abs/path/src/test.py")
+
+        with patch.object(
+            self.checker._module_resolver, "get_relative_path", return_value="src/test.py"
+        ) as mock_relative_path:
+            assert self.checker._should_check_contracts() is True
+            assert self.checker._should_check_contracts() is True
+            assert mock_relative_path.call_count == 1
+
+        assert self.checker._folder_decisions == {"/abs/path/src/test.py": True}
+
     def test_should_check_contracts_no_configuration(self):
         """Test contract checking with no folder configuration."""
         self.mock_linter.config.import_linter_target_folders = ()
@@ -277,6 +647,30 @@ class TestPatternMatching:
 
         assert self.checker._module_matches_pattern("domains.billing", mock_pattern) is True
 
+    @pytest.mark.parametrize(
+        "current_module, imported_module, violation_importer, violation_imported, expected",
+        [
+            ("domains.billing", "domains.document", "domains.billing", "domains.document", True),
+            ("billing", "domains.document.core", "domains.billing", "domains.document", True),
+            ("billing", "domains.document2", "domains.billing", "domains.document", True),
+            ("ing", "domains.document.core", "domains.billing", "domains.document", True),
+            ("ing", "domains.document2", "domains.billing", "domains.document", False),
+            ("src.domains.billing", "domains.document2", "domains.billing", "domains", True),
+            ("domains.billing", "domains.other", "domains.billing", "domains.document", False),
+        ],
+    )
+    def test_matches_violation(
+        self, current_module, imported_module, violation_importer, violation_imported, expected
+    ):
+        matcher = self.checker._contract_checker.violation_matcher
+
+        assert (
+            matcher.matches_violation(
+                current_module, imported_module, violation_importer, violation_imported
+            )
+            is expected
+        )
+
 
 class TestContractChecking:
     """Test contract violation detection logic."""
@@ -375,6 +769,164 @@ class TestContractChecking:
         result3 = self.checker._modules_are_same_domain("document", "billing")
         assert result3 is False
 
+    def test_contract_import_result_is_memoised_until_close(self):
+        """Test that each (contract, importer, imported) combination is only checked once."""
+        self.mock_linter.config.import_linter_target_folders = ()
+        self.mock_linter.config.import_linter_exclude_folders = ()
+        contract_checker_ = self.checker._contract_checker
+        contract, contract_check = Mock(), Mock()
+
+        with patch.object(
+            contract_checker_, "_check_contract_against_import_uncached", return_value=True
+        ) as mock_check:
+            for _ in range(2):
+                assert self.checker._check_contract_against_import(
+                    contract, contract_check, "domains.document.core", "domains.billing"
+                )
+            assert mock_check.call_count == 1
+
+            self.checker._check_contract_against_import(
+                contract, contract_check, "domains.document.core", "domains.users"
+            )
+            assert mock_check.call_count == 2
+
+            self.checker.close()
+            self.checker._check_contract_against_import(
+                contract, contract_check, "domains.document.core", "domains.billing"
+            )
+            assert mock_check.call_count == 3
+
+    @pytest.mark.parametrize(
+        "contract, expected_kind",
+        [
+            (
+                SimpleNamespace(source_modules=["a"], forbidden_modules=["b"], modules=["c"]),
+                "forbidden",
+            ),
+            (SimpleNamespace(modules=["a", "b"]), "independence"),
+            (SimpleNamespace(source_modules=["a"], allowed_modules=["b"]), "whitelist"),
+            (SimpleNamespace(layers=["a", "b"]), None),
+        ],
+    )
+    def test_contract_kind_is_resolved_once_per_contract(self, contract, expected_kind):
+        """Test that contracts are classified once, not for every import checked."""
+        contract_checker_ = self.checker._contract_checker
+        contract_check = ContractCheck(kept=False, metadata={})
+
+        with patch.object(
+            contract_checker_,
+            "_build_contract_info",
+            wraps=contract_checker_._build_contract_info,
+        ) as mock_build:
+            for imported_module in ("a.one", "b.two"):
+                contract_checker_._check_contract_against_import(
+                    contract, contract_check, "c.three", imported_module
+                )
+
+        assert mock_build.call_count == 1
+        assert contract_checker_._get_contract_info(contract).kind == expected_kind
+
+    def test_violation_links_are_flattened_once_per_contract_check(self):
+        """Test that invalid chain links are deduplicated and only walked once."""
+        link = {"importer": "domains.document.core", "imported": "domains.billing.payments"}
+        other_link = {"importer": "domains.billing.payments", "imported": "shared.db"}
+        contract_check = ContractCheck(
+            kept=False,
+            metadata={
+                "invalid_chains": [
+                    {"chains": [[link, other_link]]},
+                    {"chains": [[link]], "extra": "ignored"},
+                ]
+            },
+        )
+        contract_checker_ = self.checker._contract_checker
+
+        with patch.object(
+            contract_checker,
+            "_iter_violation_links",
+            wraps=contract_checker._iter_violation_links,
+        ) as mock_iter_links:
+            links = contract_checker_._get_violation_links(contract_check).links
+            assert contract_checker_._check_metadata_violations(
+                contract_check, "domains.document.core", "domains.billing.payments"
+            )
+            assert contract_checker_._check_metadata_violations(
+                contract_check, "document.core", "domains.billing.payments.models"
+            )
+            assert not contract_checker_._check_metadata_violations(
+                contract_check, "domains.users.core", "shared.cache"
+            )
+
+        assert links == (
+            ("domains.document.core", "domains.billing.payments"),
+            ("domains.billing.payments", "shared.db"),
+        )
+        assert mock_iter_links.call_count == 1
+
+    def test_violation_link_candidates_are_narrowed_by_imported_module(self):
+        """Test that only links whose imported module prefixes the import are compared."""
+        violation_links = contract_checker._ViolationLinks.from_links(
+            iter(
+                [
+                    ("app.a", "domains.billing"),
+                    ("app.b", "domains.billing.payments"),
+                    ("app.c", "domains.billing.paymentsx"),
+                    ("app.d", "domains.users"),
+                    ("app.e", "domains.billing"),
+                ]
+            )
+        )
+
+        candidates = set(violation_links.iter_candidates("domains.billing.payments.models"))
+
+        assert candidates == {
+            ("app.a", "domains.billing"),
+            ("app.e", "domains.billing"),
+            ("app.b", "domains.billing.payments"),
+        }
+
+    def test_imported_module_prefixes_of_broken_contracts(self):
+        """Test that prefixes come from broken contracts' targets and violation links."""
+        forbidden = SimpleNamespace(
+            source_modules=["domains.document"], forbidden_modules=["domains.billing.*"]
+        )
+        forbidden_check = ContractCheck(
+            kept=False,
+            metadata={
+                "invalid_chains": [
+                    {"chains": [[{"importer": "domains.document.core", "imported": "shared.db"}]]}
+                ]
+            },
+        )
+        independence = SimpleNamespace(modules=["*.users", "domains.auth"])
+        kept = SimpleNamespace(source_modules=["a"], forbidden_modules=["kept.module"])
+        report = Mock()
+        report.get_contracts_and_checks.return_value = [
+            (forbidden, forbidden_check),
+            (independence, ContractCheck(kept=False)),
+            (kept, ContractCheck(kept=True)),
+        ]
+
+        prefixes = self.checker._contract_checker.get_imported_module_prefixes(report)
+
+        assert sorted(prefixes) == ["", "domains.auth", "domains.billing.", "shared.db"]
+
+    def test_import_outside_imported_module_prefixes_is_not_a_violation(self):
+        """Test that imports of unrelated modules are rejected before checking contracts."""
+        import_node = Mock(modname="shared.utils", level=0)
+        import_node.root.return_value.file = "/abs/path/example/domains/document/core.py"
+        report = Mock()
+        contract_checker_ = self.checker._contract_checker
+
+        with patch.object(contract_checker_, "_check_contract_against_import") as mock_check:
+            result = contract_checker_.is_import_violation(
+                import_node, report, ("domains.billing.",)
+            )
+
+        assert result is False
+        mock_check.assert_not_called()
+        report.get_contracts_and_checks.assert_not_called()
+
 
 class TestImportViolationDetection:
     """Test the _is_import_violation method."""
@@ -460,6 +1012,122 @@ class TestImportViolationDetection:
 
         assert result is True
 
+    @pytest.mark.parametrize(
+        "source, expected_module",
+        [
+            ("import domains.billing.payments", "domains.billing.payments"),
+            ("from domains.billing import payments", "domains.billing"),
+            ("from .payments import Payment", "domains.billing.payments"),
+            ("from . import payments", "domains.billing.payments"),
+        ],
+    )
+    def test_imported_module_from_astroid_nodes(self, source, expected_module):
+        """Test module extraction and relative import resolution on real astroid nodes."""
+        import_node = astroid.extract_node(source)
+        contract_checker_ = self.checker._contract_checker
+
+        imported_module = contract_checker_._extract_imported_module(import_node)
+        resolved_module = contract_checker_._resolve_relative_import(
+            imported_module, import_node, "domains.billing.service"
+        )
+
+        assert resolved_module == expected_module
+
+    @pytest.mark.parametrize(
+        "current_module, expected_module",
+        [("domains.billing.service", "domains.billing.payments"), ("service", None)],
+    )
+    def test_relative_import_package_is_memoised(self, current_module, expected_module):
+        """Test that the package of the importing module is only worked out once."""
+        import_node = astroid.extract_node("from .payments import Payment")
+        contract_checker_ = self.checker._contract_checker
+
+        for _ in range(2):
+            resolved_module = contract_checker_._resolve_relative_import(
+                ".payments", import_node, current_module
+            )
+            assert resolved_module == expected_module
+
+        assert list(contract_checker_._package_cache) == [current_module]
+
+    @pytest.mark.parametrize("debug", [False, True])
+    def test_is_import_violation_only_prints_in_debug_mode(self, debug, capsys):
+        """Test the debug and non-debug paths agree, and only the debug one prints."""
+        import_node = Mock(modname="domains.billing.payments", level=0)
+        import_node.root.return_value = Mock(file="/abs/path/domains/document/core.py")
+        contract = SimpleNamespace(
+            name="Forbidden", source_modules=["domains.document"], forbidden_modules=["other"]
+        )
+        contract_check = ContractCheck(
+            kept=False,
+            metadata={
+                "invalid_chains": [
+                    {
+                        "chains": [
+                            [{"importer": "domains.document.core", "imported": "domains.billing"}]
+                        ]
+                    }
+                ]
+            },
+        )
+        contracts_cache = Mock()
+        contracts_cache.get_contracts_and_checks.return_value = [(contract, contract_check)]
+        contract_checker_ = self.checker._contract_checker
+        contract_checker_.debug = debug
+        contract_checker_.violation_matcher.debug = False
+
+        with patch.object(
+            contract_checker_.module_resolver,
+            "get_module_path_from_file",
+            return_value="domains.document.core",
+        ):
+            result = contract_checker_.is_import_violation(import_node, contracts_cache)
+
+        assert result is True
+        assert bool(capsys.readouterr().out) is debug
+
+    def test_import_is_resolved_once_per_node(self):
+        """Test that reporting a violation reuses the resolution done to detect it."""
+        import_node = Mock(modname="domains.billing.payments", level=0)
+        import_node.root.return_value = Mock(file="/abs/path/domains/document/core.py")
+        contract_checker_ = self.checker._contract_checker
+
+        with patch.object(
+            contract_checker_.module_resolver,
+            "get_module_path_from_file",
+            return_value="domains.document.core",
+        ):
+            for _ in range(2):
+                assert contract_checker_.resolve_import(import_node) == (
+                    "/abs/path/domains/document/core.py",
+                    "domains.document.core",
+                    "domains.billing.payments",
+                )
+            assert import_node.root.call_count == 1
+
+            contract_checker_.clear_cache()
+            contract_checker_.resolve_import(import_node)
+            assert import_node.root.call_count == 2
+
+    def test_resolved_modules_and_violation_links_are_interned(self):
+        """Test that module names from imports and from violation links share objects."""
+        module_name = "".join(["domains.billing.", "payments"])
+        import_node = Mock(modname=module_name, level=0)
+        import_node.root.return_value = Mock(file="/abs/path/domains/document/core.py")
+        contract_checker_ = self.checker._contract_checker
+
+        with patch.object(
+            contract_checker_.module_resolver,
+            "get_module_path_from_file",
+            return_value="domains.document.core",
+        ):
+            _, _, imported_module = contract_checker_.resolve_import(import_node)
+        [(_, link_imported)] = contract_checker._ViolationLinks.from_links(
+            iter([("domains.document.core", "".join(["domains.billing.", "payments"]))])
+        ).links
+
+        assert imported_module is link_imported
+
 
 class TestErrorHandling:
     """Test error handling in the plugin."""
@@ -513,6 +1181,113 @@ class TestErrorHandling:
         args = self.checker.add_message.call_args
         assert "Unexpected error: Unexpected error" in args[1]["args"][0]
 
+    @pytest.mark.parametrize(
+        "error",
+        [
+            type("NotATopLevelModule", (Exception,), {})(),
+            RuntimeError("grimp.exceptions.NotATopLevelModule: my-package"),
+        ],
+    )
+    def test_check_import_contracts_skips_package_structure_errors(self, error):
+        """Test that NotATopLevelModule errors are not reported."""
+        with patch("importlinter.application.use_cases.read_user_options", side_effect=error):
+            self.checker._check_import_contracts()
+
+        self.checker.add_message.assert_not_called()
+
+    @patch("importlinter.application.use_cases.read_user_options")
+    def test_check_import_contracts_error_includes_traceback_in_debug(
+        self, mock_read_user_options
+    ):
+        """Test that debug mode adds the traceback to error messages."""
+        mock_read_user_options.side_effect = ImportError("Test import error")
+        self.checker._contract_checker.debug = True
+
+        self.checker._check_import_contracts()
+
+        message = self.checker.add_message.call_args[1]["args"][0]
+        assert message.startswith("Test import error\nDebug traceback:\nTraceback")
+
+
+class TestReportBuilding:
+    """Test how the report is built when contracts are checked."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_linter = Mock()
+        self.mock_linter.config = Mock()
+        self.mock_linter.config.import_linter_contract = ()
+        self.mock_linter.config.import_linter_cache_dir = None
+        self.mock_linter.config.import_linter_no_cache = False
+        self.mock_linter.config.import_linter_verbose = False
+        self.mock_linter.config.import_linter_show_timings = False
+        self.mock_linter.config.import_linter_debug = False
+        self.mock_linter.config.import_linter_fast_mode = False
+
+    def _check_contracts(self):
+        checker_ = ImportLinterChecker(self.mock_linter)
+        return checker_._contract_checker.check_import_contracts(Mock(), False, None)
+
+    def test_report_is_rebuilt_for_every_run(self, tmp_path):
+        """The analysed code can change between runs in one process, so nothing is reused."""
+        config_file = tmp_path / ".importlinter"
+        config_file.write_text("[importlinter]\n")
+        self.mock_linter.config.import_linter_config = str(config_file)
+        first_report, second_report = Mock(contains_failures=True), Mock(contains_failures=True)
+
+        with (
+            patch("importlinter.application.use_cases.read_user_options") as mock_read_options,
+            patch("importlinter.application.use_cases._register_contract_types"),
+            patch("importlinter.application.use_cases.create_report") as mock_create_report,
+        ):
+            mock_read_options.return_value = Mock(contracts_options=[])
+            mock_create_report.side_effect = [first_report, second_report]
+
+            assert self._check_contracts() is first_report
+            assert self._check_contracts() is second_report
+            assert mock_create_report.call_count == 2
+
+    def test_settings_are_configured_once_when_building_a_report(self):
+        self.mock_linter.config.import_linter_config = None
+
+        with (
+            patch.object(contract_checker, "_configured", False),
+            patch.dict(settings._config, clear=True),
+            patch("importlinter.configuration.configure") as mock_configure,
+            patch("importlinter.application.use_cases.read_user_options") as mock_read_options,
+            patch("importlinter.application.use_cases._register_contract_types"),
+            patch("importlinter.application.use_cases.create_report") as mock_create_report,
+        ):
+            mock_read_options.return_value = Mock(contracts_options=[])
+            mock_create_report.return_value = Mock(contains_failures=True)
+
+            ImportLinterChecker(self.mock_linter)
+            mock_configure.assert_not_called()
+
+            self._check_contracts()
+            self._check_contracts()
+
+            mock_configure.assert_called_once_with()
+
+    def test_settings_configured_by_the_host_are_kept(self):
+        self.mock_linter.config.import_linter_config = None
+        graph_builder = Mock()
+
+        with (
+            patch.object(contract_checker, "_configured", False),
+            patch.dict(settings._config, {"GRAPH_BUILDER": graph_builder}, clear=True),
+            patch("importlinter.application.use_cases.read_user_options") as mock_read_options,
+            patch("importlinter.application.use_cases._register_contract_types"),
+            patch("importlinter.application.use_cases.create_report") as mock_create_report,
+        ):
+            mock_read_options.return_value = Mock(contracts_options=[])
+            mock_create_report.return_value = Mock(contains_failures=True)
+
+            self._check_contracts()
+
+            assert settings.GRAPH_BUILDER is graph_builder
+            assert contract_checker._configured is True
+
 
 class TestCacheConfiguration:
     """Test cache directory configuration logic."""
@@ -631,7 +1406,7 @@ class TestIntegrationScenarios:
             # Mock the contract checker's is_import_violation method to return True
             self.checker._contract_checker.is_import_violation = Mock(return_value=True)
 
-            # Mock the contract checker's methods used in _report_import_violation
+            # Mock the contract checker's methods used in _get_import_violation
             self.checker._contract_checker._extract_imported_module = Mock(
                 return_value="domains.billing.payments"
             )